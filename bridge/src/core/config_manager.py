@@ -51,6 +51,9 @@ else:
 
 CONFIG_FILE = os.path.join(BASE_DIR, 'config.json')
 
+# Parsed configs keyed by (path, mtime_ns); see load_config_cached()
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -81,6 +84,40 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         raise
 
 
+def load_config_cached(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load configuration, reusing the parsed result while the file is unchanged.
+
+    The cache is keyed by path and modification time, so a save (or an edit
+    on disk) is picked up on the next call. The returned dict is shared
+    between callers and must be treated as read-only; use load_config() when
+    the result is going to be modified.
+
+    Args:
+        config_path: Optional path to config file (defaults to BASE_DIR/config.json)
+
+    Returns:
+        dict: Configuration dictionary
+
+    Raises:
+        FileNotFoundError: If config file not found
+        json.JSONDecodeError: If config file is invalid JSON
+    """
+    path = config_path or CONFIG_FILE
+    key = (path, os.stat(path).st_mtime_ns)
+
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        # Only the current version of each file is worth keeping
+        for stale in [k for k in _CONFIG_CACHE if k[0] == path]:
+            del _CONFIG_CACHE[stale]
+        _CONFIG_CACHE[key] = config
+        logger.debug("Configuration parsed from %s", path)
+    return config
+
+
 def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> bool:
     """
     Save configuration to config.json atomically.
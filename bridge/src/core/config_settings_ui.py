@@ -4,18 +4,197 @@ Config Settings UI using PySide6.
 Replaces the webview settings modal with a native Qt dialog.
 """
 
-import json
 import logging
 import os
 import sys
-import threading
 import ctypes
+from collections import defaultdict
+from string import Template
+
 from PySide6 import QtCore, QtGui
 
 from src.logger_module import logger as app_logger
+from src.core.runtime_env import IS_COMPILED, UI_BASE_DIR
 
 logger = app_logger
 
+_SOFTWARE_CHOICES = ("odoo", "tcpos", "simphony", "quickbooks")
+_PRINTER_CHOICES = ("cts310ii", "star", "citizen", "epson")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+_VALID_SOFTWARE = frozenset(_SOFTWARE_CHOICES)
+_VALID_PRINTERS = frozenset(_PRINTER_CHOICES)
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Lets the status line paint before RestartThread starts; the worker can end
+# this process with os._exit almost immediately when no running core is found.
+_RESTART_DELAY_MS = 150
+
+
+_STYLESHEET_TEMPLATE = Template("""
+    QMainWindow {
+        background-color: #f5f6f8;
+        color: #111827;
+    }
+    QWidget#header {
+        background: #b91c1c;
+        border-bottom: 1px solid #991b1b;
+    }
+    QLabel#title {
+        font-size: 22px;
+        font-weight: 700;
+        color: #ffffff;
+        margin: 0;
+        padding: 0;
+        line-height: 22px;
+    }
+    QLabel#subtitle {
+        font-size: 12px;
+        color: #f3d6d6;
+        margin: 0;
+        padding: 0;
+        line-height: 12px;
+    }
+    QLabel#sectionTitle {
+        font-size: 16px;
+        font-weight: 700;
+        color: #111827;
+        padding-left: 2px;
+        margin: 0;
+    }
+    QComboBox, QSpinBox {
+        padding-right: 24px;
+        font-size: 18px;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 60px;
+        margin: 2px;
+        border: none;
+        background: #f3f4f6;
+        border-radius: 8px;
+    }
+    QComboBox::down-arrow {
+        image: url($arrow_down);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center;
+    }
+    QSpinBox::up-button, QSpinBox::down-button {
+        subcontrol-origin: content;
+        subcontrol-position: center right;
+        width: 60px;
+        margin-top: 6px;
+        margin-bottom: 6px;
+        margin-right: 6px;
+        border: none;
+    }
+    QSpinBox::up-button {
+        background: transparent;
+        border-radius: 8px;
+    }
+    QSpinBox::down-button {
+        background: transparent;
+    }
+    QSpinBox::up-arrow {
+        image: url($arrow_up);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center right;
+        right: 6px;
+    }
+    QSpinBox::down-arrow {
+        image: url($arrow_down);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center right;
+        right: -12px;
+    }
+    QWidget#scroll {
+        background: transparent;
+    }
+    QGroupBox {
+        border: 1px solid #e5e7eb;
+        border-radius: 10px;
+        margin-top: 4px;
+        padding: 14px;
+        background: #ffffff;
+    }
+    QLabel#logo {
+        background: #ffffff;
+        border-radius: 10px;
+        padding: 6px;
+    }
+    QGroupBox::title {
+        padding: 0;
+        margin: 0;
+        height: 0px;
+    }
+    QCheckBox {
+        color: #111827;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 4px;
+        border: 1px solid #d1d5db;
+        background: #ffffff;
+    }
+    QCheckBox::indicator:unchecked {
+        background: #f3f4f6;
+        border-color: #d1d5db;
+    }
+    QCheckBox::indicator:checked {
+        background: #b91c1c;
+        border-color: #b91c1c;
+        image: url(:/qt-project.org/styles/commonstyle/images/standardbutton-apply-16.png);
+    }
+    QLineEdit, QComboBox, QSpinBox {
+        background: #ffffff;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #111827;
+        font-size: 18px;
+    }
+    QCheckBox {
+        color: #111827;
+    }
+    QWidget#footer {
+        background: #f3f4f6;
+        border-top: 1px solid #e5e7eb;
+    }
+    QLabel#status {
+        color: #6b7280;
+    }
+    QPushButton {
+        border: none;
+        padding: 7px 16px;
+        border-radius: 6px;
+        font-weight: 600;
+        color: #ffffff;
+    }
+    QPushButton#saveButton {
+        background-color: #b91c1c;
+    }
+    QPushButton#saveButton:hover {
+        background-color: #991b1b;
+    }
+    QPushButton#restartButton {
+        background-color: #374151;
+    }
+    QPushButton#restartButton:hover {
+        background-color: #1f2937;
+    }
+    QPushButton#closeButton {
+        background-color: #6b7280;
+    }
+    QPushButton#closeButton:hover {
+        background-color: #4b5563;
+    }
+    """)
+
 
 def _show_error_messagebox(title, message):
     """Show native Windows error dialog for debugging modal failures."""
@@ -38,25 +217,6 @@ def _install_excepthook():
         pass
 
 
-def _is_compiled() -> bool:
-    if "__compiled__" in dir():
-        return True
-    if getattr(sys, "frozen", False):
-        return True
-    if ".dist" in sys.executable:
-        return True
-    return False
-
-
-def _resolve_base_dir() -> str:
-    env_base = os.environ.get("BAB_UI_BASE")
-    if env_base:
-        return env_base.strip()
-    if _is_compiled():
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
 def _get_nested(config, path, default=None):
     current = config
     for key in path:
@@ -66,49 +226,191 @@ def _get_nested(config, path, default=None):
     return current
 
 
+def _diff_changes(changes, base):
+    """Return the subset of changes whose values differ from base."""
+    diff = {}
+    for key, value in changes.items():
+        current = base.get(key) if isinstance(base, dict) else None
+        if isinstance(value, dict):
+            nested = _diff_changes(value, current)
+            if nested:
+                diff[key] = nested
+        elif value != current:
+            diff[key] = value
+    return diff
+
+
+def _choice(valid, label):
+    def check(value):
+        if value not in valid:
+            return f"Invalid {label}: {value}"
+        return None
+    return check
+
+
+def _int_range(low, high, range_error, type_error):
+    def check(value):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return type_error
+        if value < low or value > high:
+            return range_error
+        return None
+    return check
+
+
+# (path, validator) pairs checked by _validate_changes; a validator returns an
+# error message or None. Paths missing from the changes are skipped.
+_VALIDATORS = (
+    (("software", "active"), _choice(_VALID_SOFTWARE, "software")),
+    (("printer", "active"), _choice(_VALID_PRINTERS, "printer")),
+    (
+        ("polling", "printer_retry_interval_seconds"),
+        _int_range(
+            1, 300,
+            "printer_retry_interval_seconds must be between 1 and 300 seconds",
+            "printer_retry_interval_seconds must be a number",
+        ),
+    ),
+    (
+        ("polling", "software_retry_interval_seconds"),
+        _int_range(
+            1, 300,
+            "software_retry_interval_seconds must be between 1 and 300 seconds",
+            "software_retry_interval_seconds must be a number",
+        ),
+    ),
+    (
+        ("babportal", "poll_interval"),
+        _int_range(
+            1, 60,
+            "BABPortal poll interval must be between 1 and 60 seconds",
+            "BABPortal poll interval must be a number",
+        ),
+    ),
+    (("system", "log_level"), _choice(_VALID_LOG_LEVELS, "log level")),
+)
+
+_MISSING = object()
+
+
 def _validate_changes(changes):
     errors = []
+    for path, check in _VALIDATORS:
+        value = _get_nested(changes, path, _MISSING)
+        if value is _MISSING:
+            continue
+        error = check(value)
+        if error:
+            errors.append(error)
+    return errors
+
 
-    if "software" in changes and "active" in changes["software"]:
-        valid_software = ["odoo", "tcpos", "simphony", "quickbooks"]
-        if changes["software"]["active"] not in valid_software:
-            errors.append(f"Invalid software: {changes['software']['active']}")
-
-    if "printer" in changes and "active" in changes["printer"]:
-        valid_printers = ["cts310ii", "star", "citizen", "epson"]
-        if changes["printer"]["active"] not in valid_printers:
-            errors.append(f"Invalid printer: {changes['printer']['active']}")
-
-    if "polling" in changes:
-        for key in ["printer_retry_interval_seconds", "software_retry_interval_seconds"]:
-            if key in changes["polling"]:
-                try:
-                    value = int(changes["polling"][key])
-                    if value < 1 or value > 300:
-                        errors.append(f"{key} must be between 1 and 300 seconds")
-                except ValueError:
-                    errors.append(f"{key} must be a number")
-
-    if "babportal" in changes and "poll_interval" in changes["babportal"]:
+def _restart_core():
+    """Stop the running core and start a new one, then exit this modal.
+
+    Blocks while the old core shuts down, so run it off the GUI thread.
+    """
+    import subprocess
+    import time
+
+    current_pid = os.getpid()
+    main_process = None
+    psutil = None
+    try:
+        import psutil as _psutil
+        psutil = _psutil
+    except Exception:
+        psutil = None
+
+    if psutil:
+        for proc in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
+            try:
+                if proc.pid == current_pid:
+                    continue
+                cmdline = " ".join(proc.info.get("cmdline") or [])
+                if "--modal" in cmdline:
+                    continue
+                if "fiscal_printer_hub" in cmdline or "BAB-PrintHub" in cmdline:
+                    main_process = proc
+                    break
+                if IS_COMPILED:
+                    exe = proc.info.get("exe")
+                    if exe and os.path.basename(exe).lower() == os.path.basename(sys.executable).lower():
+                        main_process = proc
+                        break
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+    def _resolve_main_executable():
+        if not IS_COMPILED:
+            return None
+        exe = sys.executable
+        arg_text = " ".join(sys.argv)
+        base_dir = os.path.dirname(exe)
+        if "--modal" in arg_text or "ui_modal_runner" in os.path.basename(exe).lower():
+            try:
+                from src.version import VERSION
+                candidate = os.path.join(base_dir, f"BAB-PrintHub-v{VERSION}.exe")
+                if os.path.exists(candidate):
+                    return candidate
+            except Exception:
+                pass
+            for name in os.listdir(base_dir):
+                if name.lower().startswith("bab-printhub-v") and name.lower().endswith(".exe"):
+                    return os.path.join(base_dir, name)
+        return exe
+
+    if main_process:
         try:
-            value = int(changes["babportal"]["poll_interval"])
-            if value < 1 or value > 60:
-                errors.append("BABPortal poll interval must be between 1 and 60 seconds")
-        except ValueError:
-            errors.append("BABPortal poll interval must be a number")
+            main_process.terminate()
+            main_process.wait(timeout=5)
+        except Exception:
+            main_process.kill()
+            main_process.wait(timeout=3)
+        time.sleep(2)
+    elif IS_COMPILED:
+        target_exe = _resolve_main_executable()
+        exe_name = os.path.basename(target_exe or sys.executable)
+        cmd = f'timeout /t 2 /nobreak >nul & taskkill /F /IM "{exe_name}" >nul 2>&1 & start "" "{sys.executable}"'
+        subprocess.Popen(
+            ["cmd", "/c", cmd],
+            cwd=os.path.dirname(sys.executable),
+            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+        )
+        os._exit(0)
+
+    if IS_COMPILED:
+        executable = _resolve_main_executable() or sys.executable
+        subprocess.Popen([executable], cwd=os.path.dirname(executable))
+    else:
+        bridge_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        subprocess.Popen(
+            ["py", "-3.13", "-m", "src.fiscal_printer_hub"],
+            cwd=bridge_dir,
+            creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == "nt" else 0,
+        )
 
-    if "system" in changes and "log_level" in changes["system"]:
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if changes["system"]["log_level"] not in valid_levels:
-            errors.append(f"Invalid log level: {changes['system']['log_level']}")
+    os._exit(0)
 
-    return errors
+
+class RestartThread(QtCore.QThread):
+    # Only emitted on failure; on success the process exits from _restart_core.
+    restart_failed = QtCore.Signal(str)
+
+    def run(self):
+        try:
+            _restart_core()
+        except Exception as exc:
+            logger.error("Error restarting application: %s", exc)
+            self.restart_failed.emit(str(exc))
 
 
 class ConfigSettingsWindow:
     def __init__(self, config_path, config):
         from PySide6.QtCore import Qt
-        from PySide6.QtGui import QIcon
+        from PySide6.QtGui import QIcon, QPixmap
         from PySide6.QtWidgets import (
             QMainWindow,
             QWidget,
@@ -130,6 +432,7 @@ class ConfigSettingsWindow:
         self._QMessageBox = QMessageBox
         self.config_path = config_path
         self.config = config
+        self._restart_thread = None
 
         _install_excepthook()
 
@@ -138,12 +441,16 @@ class ConfigSettingsWindow:
         self.window.resize(960, 720)
         self.window.setMinimumSize(820, 600)
 
-        base_dir = _resolve_base_dir()
+        base_dir = UI_BASE_DIR
         icon_path = os.path.join(base_dir, "src", "assets", "logo.png")
         arrow_down_path = os.path.join(base_dir, "src", "assets", "icons", "arrow_down.svg")
         arrow_up_path = os.path.join(base_dir, "src", "assets", "icons", "arrow_up.svg")
-        if os.path.exists(icon_path):
-            self.window.setWindowIcon(QIcon(icon_path))
+        # Decode logo.png once and reuse it for the window icon and header.
+        logo_pix = QPixmap(icon_path) if os.path.exists(icon_path) else None
+        if logo_pix is not None and logo_pix.isNull():
+            logo_pix = None
+        if logo_pix is not None:
+            self.window.setWindowIcon(QIcon(logo_pix))
 
         central = QWidget()
         self.window.setCentralWidget(central)
@@ -172,12 +479,8 @@ class ConfigSettingsWindow:
 
         logo_label = QLabel()
         logo_label.setObjectName("logo")
-        if os.path.exists(icon_path):
-            from PySide6.QtGui import QPixmap
-
-            pix = QPixmap(icon_path)
-            if not pix.isNull():
-                logo_label.setPixmap(pix.scaled(64, 64, self._Qt.KeepAspectRatio, self._Qt.SmoothTransformation))
+        if logo_pix is not None:
+            logo_label.setPixmap(logo_pix.scaled(64, 64, self._Qt.KeepAspectRatio, self._Qt.SmoothTransformation))
         header_layout.setAlignment(self._Qt.AlignVCenter)
         header_layout.addWidget(logo_label)
         header_layout.addSpacing(12)
@@ -230,6 +533,7 @@ class ConfigSettingsWindow:
         save_btn.clicked.connect(self.save_config)
         close_btn.clicked.connect(self.window.close)
 
+        self._collect_spec = self._build_collect_spec()
         self._apply_styles(arrow_down_path, arrow_up_path)
         self._load_config()
         QtCore.QTimer.singleShot(0, self._finalize_layout)
@@ -247,171 +551,7 @@ class ConfigSettingsWindow:
     def _apply_styles(self, arrow_down_path, arrow_up_path):
         arrow_down_url = arrow_down_path.replace("\\", "/")
         arrow_up_url = arrow_up_path.replace("\\", "/")
-        style = """
-            QMainWindow {
-                background-color: #f5f6f8;
-                color: #111827;
-            }
-            QWidget#header {
-                background: #b91c1c;
-                border-bottom: 1px solid #991b1b;
-            }
-            QLabel#title {
-                font-size: 22px;
-                font-weight: 700;
-                color: #ffffff;
-                margin: 0;
-                padding: 0;
-                line-height: 22px;
-            }
-            QLabel#subtitle {
-                font-size: 12px;
-                color: #f3d6d6;
-                margin: 0;
-                padding: 0;
-                line-height: 12px;
-            }
-            QLabel#sectionTitle {
-                font-size: 16px;
-                font-weight: 700;
-                color: #111827;
-                padding-left: 2px;
-                margin: 0;
-            }
-            QComboBox, QSpinBox {
-                padding-right: 24px;
-                font-size: 18px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 60px;
-                margin: 2px;
-                border: none;
-                background: #f3f4f6;
-                border-radius: 8px;
-            }
-            QComboBox::down-arrow {
-                image: url(__ARROW_DOWN__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                subcontrol-origin: content;
-                subcontrol-position: center right;
-                width: 60px;
-                margin-top: 6px;
-                margin-bottom: 6px;
-                margin-right: 6px;
-                border: none;
-            }
-            QSpinBox::up-button {
-                background: transparent;
-                border-radius: 8px;
-            }
-            QSpinBox::down-button {
-                background: transparent;
-            }
-            QSpinBox::up-arrow {
-                image: url(__ARROW_UP__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center right;
-                right: 6px;
-            }
-            QSpinBox::down-arrow {
-                image: url(__ARROW_DOWN__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center right;
-                right: -12px;
-            }
-            QWidget#scroll {
-                background: transparent;
-            }
-            QGroupBox {
-                border: 1px solid #e5e7eb;
-                border-radius: 10px;
-                margin-top: 4px;
-                padding: 14px;
-                background: #ffffff;
-            }
-            QLabel#logo {
-                background: #ffffff;
-                border-radius: 10px;
-                padding: 6px;
-            }
-            QGroupBox::title {
-                padding: 0;
-                margin: 0;
-                height: 0px;
-            }
-            QCheckBox {
-                color: #111827;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 4px;
-                border: 1px solid #d1d5db;
-                background: #ffffff;
-            }
-            QCheckBox::indicator:unchecked {
-                background: #f3f4f6;
-                border-color: #d1d5db;
-            }
-            QCheckBox::indicator:checked {
-                background: #b91c1c;
-                border-color: #b91c1c;
-                image: url(:/qt-project.org/styles/commonstyle/images/standardbutton-apply-16.png);
-            }
-            QLineEdit, QComboBox, QSpinBox {
-                background: #ffffff;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #111827;
-                font-size: 18px;
-            }
-            QCheckBox {
-                color: #111827;
-            }
-            QWidget#footer {
-                background: #f3f4f6;
-                border-top: 1px solid #e5e7eb;
-            }
-            QLabel#status {
-                color: #6b7280;
-            }
-            QPushButton {
-                border: none;
-                padding: 7px 16px;
-                border-radius: 6px;
-                font-weight: 600;
-                color: #ffffff;
-            }
-            QPushButton#saveButton {
-                background-color: #b91c1c;
-            }
-            QPushButton#saveButton:hover {
-                background-color: #991b1b;
-            }
-            QPushButton#restartButton {
-                background-color: #374151;
-            }
-            QPushButton#restartButton:hover {
-                background-color: #1f2937;
-            }
-            QPushButton#closeButton {
-                background-color: #6b7280;
-            }
-            QPushButton#closeButton:hover {
-                background-color: #4b5563;
-            }
-            """
-        style = style.replace("__ARROW_DOWN__", arrow_down_url)
-        style = style.replace("__ARROW_UP__", arrow_up_url)
+        style = _STYLESHEET_TEMPLATE.substitute(arrow_down=arrow_down_url, arrow_up=arrow_up_url)
         self.window.setStyleSheet(style)
 
     def _build_general_section(self):
@@ -420,7 +560,7 @@ class ConfigSettingsWindow:
         group = QGroupBox("")
         form = QFormLayout(group)
         self.software_active = QComboBox()
-        self.software_active.addItems(["odoo", "tcpos", "simphony", "quickbooks"])
+        self.software_active.addItems(list(_SOFTWARE_CHOICES))
         self.mode_display = QLineEdit()
         self.mode_display.setReadOnly(True)
         self.mode_display.setObjectName("inputField")
@@ -435,7 +575,7 @@ class ConfigSettingsWindow:
         printer_group = QGroupBox("")
         printer_form = QFormLayout(printer_group)
         self.printer_active = QComboBox()
-        self.printer_active.addItems(["cts310ii", "star", "citizen", "epson"])
+        self.printer_active.addItems(list(_PRINTER_CHOICES))
         self.printer_com_port = QLineEdit()
         self.printer_baud_rate = QSpinBox()
         self.printer_baud_rate.setRange(1200, 115200)
@@ -496,7 +636,7 @@ class ConfigSettingsWindow:
         group = QGroupBox("")
         form = QFormLayout(group)
         self.system_log_level = QComboBox()
-        self.system_log_level.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.system_log_level.addItems(list(_LOG_LEVELS))
         self.system_demo_mode = QCheckBox("Enable demo mode")
         form.addRow("Log level", self.system_log_level)
         form.addRow("", self.system_demo_mode)
@@ -562,37 +702,41 @@ class ConfigSettingsWindow:
         else:
             self.status_label.setStyleSheet("color: #94a3b8;")
 
+    def _build_collect_spec(self):
+        """Pre-bind (section, key, getter) records read by _collect_changes."""
+        def stripped(line_edit):
+            return lambda: line_edit.text().strip()
+
+        return (
+            ("software", "active", self.software_active.currentText),
+            ("babportal", "enabled", self.babportal_enabled.isChecked),
+            ("babportal", "url", stripped(self.babportal_url)),
+            ("babportal", "device_id", stripped(self.babportal_device_id)),
+            ("babportal", "device_token", stripped(self.babportal_device_token)),
+            ("babportal", "poll_interval", self.babportal_poll_interval.value),
+            ("babportal", "wordpress_username", stripped(self.babportal_wp_username)),
+            ("babportal", "wordpress_app_password", stripped(self.babportal_wp_password)),
+            ("polling", "printer_retry_interval_seconds", self.poll_printer_retry.value),
+            ("polling", "software_retry_interval_seconds", self.poll_software_retry.value),
+            ("system", "log_level", self.system_log_level.currentText),
+            ("system", "demo_mode", self.system_demo_mode.isChecked),
+        )
+
     def _collect_changes(self):
+        changes = defaultdict(dict)
+        for section, key, getter in self._collect_spec:
+            changes[section][key] = getter()
+
+        # The printer section nests its details under the active printer name.
         active_printer = self.printer_active.currentText()
-        return {
-            "software": {
-                "active": self.software_active.currentText(),
-            },
-            "printer": {
-                "active": active_printer,
-                active_printer: {
-                    "com_port": self.printer_com_port.text().strip(),
-                    "baud_rate": int(self.printer_baud_rate.value()),
-                },
-            },
-            "babportal": {
-                "enabled": self.babportal_enabled.isChecked(),
-                "url": self.babportal_url.text().strip(),
-                "device_id": self.babportal_device_id.text().strip(),
-                "device_token": self.babportal_device_token.text().strip(),
-                "poll_interval": int(self.babportal_poll_interval.value()),
-                "wordpress_username": self.babportal_wp_username.text().strip(),
-                "wordpress_app_password": self.babportal_wp_password.text().strip(),
-            },
-            "polling": {
-                "printer_retry_interval_seconds": int(self.poll_printer_retry.value()),
-                "software_retry_interval_seconds": int(self.poll_software_retry.value()),
-            },
-            "system": {
-                "log_level": self.system_log_level.currentText(),
-                "demo_mode": self.system_demo_mode.isChecked(),
+        changes["printer"] = {
+            "active": active_printer,
+            active_printer: {
+                "com_port": self.printer_com_port.text().strip(),
+                "baud_rate": self.printer_baud_rate.value(),
             },
         }
+        return dict(changes)
 
     def save_config(self):
         changes = self._collect_changes()
@@ -601,34 +745,45 @@ class ConfigSettingsWindow:
             self._set_status("Validation failed: " + ", ".join(errors), is_error=True)
             return
 
+        # Merge only the values that differ from what is on disk.
+        delta = _diff_changes(changes, self.config)
+        if not delta:
+            # Nothing to write and no reason to restart the core.
+            self._set_status("No changes to save")
+            return
+
         try:
-            updated = json.loads(json.dumps(self.config))
+            # Copy only the sections (and nested dicts) being changed so
+            # self.config is never mutated and untouched sections are shared.
+            updated = dict(self.config)
 
             for section in ["software", "printer", "client", "miscellaneous", "polling", "babportal", "system"]:
-                if section not in changes:
+                if section not in delta:
                     continue
-                if section not in updated:
-                    updated[section] = {}
-                for key, value in changes[section].items():
+                merged = dict(updated.get(section) or {})
+                for key, value in delta[section].items():
                     if isinstance(value, dict):
-                        if key not in updated[section]:
-                            updated[section][key] = {}
-                        updated[section][key].update(value)
+                        merged[key] = {**merged.get(key, {}), **value}
                     else:
-                        updated[section][key] = value
+                        merged[key] = value
+                updated[section] = merged
 
-            if "software" in changes and "active" in changes["software"]:
-                active_software = changes["software"]["active"]
-                for software_name in ["odoo", "tcpos", "simphony", "quickbooks"]:
-                    if software_name in updated["software"]:
-                        updated["software"][software_name]["enabled"] = (software_name == active_software)
+            if "active" in delta.get("software", {}):
+                active_software = delta["software"]["active"]
+                software = updated["software"]
+                for software_name in _SOFTWARE_CHOICES:
+                    if software_name in software:
+                        software[software_name] = {
+                            **software[software_name],
+                            "enabled": software_name == active_software,
+                        }
 
-            with open(self.config_path, "w", encoding="utf-8") as handle:
-                json.dump(updated, handle, indent=2)
+            from src.core.config_manager import save_config
+
+            save_config(updated, self.config_path)
 
             self._set_status("Saved. Restarting core...")
-            thread = threading.Thread(target=self._restart_with_delay, daemon=False)
-            thread.start()
+            QtCore.QTimer.singleShot(_RESTART_DELAY_MS, self._restart_application)
         except Exception as exc:
             logger.error("Error saving config: %s", exc)
             self._set_status(f"Save failed: {exc}", is_error=True)
@@ -645,109 +800,36 @@ class ConfigSettingsWindow:
             return
 
         self._set_status("Restarting core...")
-        thread = threading.Thread(target=self._restart_with_delay, daemon=False)
-        thread.start()
-
-    def _restart_with_delay(self):
-        import time
-        time.sleep(2)
-        self._restart_application()
+        QtCore.QTimer.singleShot(_RESTART_DELAY_MS, self._restart_application)
 
     def _restart_application(self):
-        try:
-            import subprocess
-            import time
+        if self._restart_thread is not None and self._restart_thread.isRunning():
+            return
+        self._restart_thread = RestartThread(self.window)
+        self._restart_thread.restart_failed.connect(self._on_restart_failed)
+        self._restart_thread.start()
 
-            current_pid = os.getpid()
-            main_process = None
-            psutil = None
-            try:
-                import psutil as _psutil
-                psutil = _psutil
-            except Exception:
-                psutil = None
-
-            if psutil:
-                for proc in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
-                    try:
-                        if proc.pid == current_pid:
-                            continue
-                        cmdline = " ".join(proc.info.get("cmdline") or [])
-                        if "--modal" in cmdline:
-                            continue
-                        if "fiscal_printer_hub" in cmdline or "BAB-PrintHub" in cmdline:
-                            main_process = proc
-                            break
-                        if _is_compiled():
-                            exe = proc.info.get("exe")
-                            if exe and os.path.basename(exe).lower() == os.path.basename(sys.executable).lower():
-                                main_process = proc
-                                break
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-
-            def _resolve_main_executable():
-                if not _is_compiled():
-                    return None
-                exe = sys.executable
-                arg_text = " ".join(sys.argv)
-                base_dir = os.path.dirname(exe)
-                if "--modal" in arg_text or "ui_modal_runner" in os.path.basename(exe).lower():
-                    try:
-                        from src.version import VERSION
-                        candidate = os.path.join(base_dir, f"BAB-PrintHub-v{VERSION}.exe")
-                        if os.path.exists(candidate):
-                            return candidate
-                    except Exception:
-                        pass
-                    for name in os.listdir(base_dir):
-                        if name.lower().startswith("bab-printhub-v") and name.lower().endswith(".exe"):
-                            return os.path.join(base_dir, name)
-                return exe
-
-            if main_process:
-                try:
-                    main_process.terminate()
-                    main_process.wait(timeout=5)
-                except Exception:
-                    main_process.kill()
-                    main_process.wait(timeout=3)
-                time.sleep(2)
-            elif _is_compiled():
-                target_exe = _resolve_main_executable()
-                exe_name = os.path.basename(target_exe or sys.executable)
-                cmd = f'timeout /t 2 /nobreak >nul & taskkill /F /IM "{exe_name}" >nul 2>&1 & start "" "{sys.executable}"'
-                subprocess.Popen(
-                    ["cmd", "/c", cmd],
-                    cwd=os.path.dirname(sys.executable),
-                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
-                )
-                os._exit(0)
-
-            if _is_compiled():
-                executable = _resolve_main_executable() or sys.executable
-                subprocess.Popen([executable], cwd=os.path.dirname(executable))
-            else:
-                bridge_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                subprocess.Popen(
-                    ["py", "-3.13", "-m", "src.fiscal_printer_hub"],
-                    cwd=bridge_dir,
-                    creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == "nt" else 0,
-                )
-
-            os._exit(0)
-        except Exception as exc:
-            logger.error("Error restarting application: %s", exc)
-            self._set_status(f"Restart failed: {exc}", is_error=True)
+    def _on_restart_failed(self, message):
+        self._set_status(f"Restart failed: {message}", is_error=True)
 
 
-def _open_config_settings_window(config_path, config):
+def _open_config_settings_window(config_path):
     try:
         from PySide6.QtWidgets import QApplication
     except Exception as exc:
         _show_error_messagebox("Settings Error", f"PySide6 is not available: {exc}")
         raise
 
+    # Read the config here rather than taking it from the launcher so the
+    # form always reflects the latest state on disk.
+    try:
+        from src.core.config_manager import load_config
+
+        config = load_config(config_path)
+    except Exception as exc:
+        logger.error("Failed to load config for settings: %s", exc)
+        config = {}
+
     app = QApplication.instance()
     if app is None:
         app = QApplication([])
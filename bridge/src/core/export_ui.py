@@ -11,13 +11,198 @@ import os
 import sys
 import ctypes
 import time
+from contextlib import closing
+from string import Template
 
 from PySide6 import QtCore
 
 from src.logger_module import logger as app_logger
+from .runtime_env import UI_BASE_DIR
 
 logger = app_logger
 
+# Dates sent per salesbook.export_batch request; progress is reported per batch.
+_EXPORT_BATCH_SIZE = 7
+# Minimum seconds between progress signals; the last one is always sent.
+_PROGRESS_INTERVAL = 0.1
+# Errors meaning a day simply has nothing to export (not a failure).
+_NO_DATA_ERRORS = ("No transactions", "No salesbook data")
+
+
+_STYLESHEET_TEMPLATE = Template("""
+    QMainWindow {
+        background-color: #f5f6f8;
+        color: #111827;
+    }
+    QWidget#header {
+        background: #b91c1c;
+        border-bottom: 1px solid #991b1b;
+    }
+    QLabel#headerTitle {
+        font-size: 22px;
+        font-weight: 800;
+        color: #ffffff;
+        margin: 0;
+        padding: 0;
+        line-height: 22px;
+    }
+    QLabel#headerSubtitle {
+        font-size: 12px;
+        color: #f3d6d6;
+        margin: 0;
+        padding: 0;
+        line-height: 12px;
+    }
+    QComboBox#inputField, QDateEdit#inputField, QSpinBox#inputField {
+        padding-right: 24px;
+        font-size: 18px;
+    }
+    QComboBox#inputField::drop-down, QDateEdit#inputField::drop-down, QDateEdit::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 60px;
+        margin: 2px;
+        border: none;
+        background: #f3f4f6;
+        border-radius: 8px;
+    }
+    QComboBox#inputField::down-arrow, QDateEdit#inputField::down-arrow, QDateEdit::down-arrow {
+        image: url($arrow_down);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center;
+    }
+    QSpinBox#inputField::up-button, QSpinBox#inputField::down-button {
+        subcontrol-origin: content;
+        subcontrol-position: center right;
+        width: 60px;
+        margin-top: 6px;
+        margin-bottom: 6px;
+        margin-right: 6px;
+        border: none;
+    }
+    QSpinBox#inputField::up-button {
+        background: transparent;
+        border-radius: 8px;
+    }
+    QSpinBox#inputField::down-button {
+        background: transparent;
+    }
+    QSpinBox#inputField::up-arrow {
+        image: url($arrow_up);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center right;
+        right: 6px;
+    }
+    QSpinBox#inputField::down-arrow {
+        image: url($arrow_down);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center right;
+        right: -12px;
+    }
+    QWidget#scroll {
+        background: transparent;
+    }
+    QLabel#logo {
+        background: #ffffff;
+        border-radius: 10px;
+        padding: 6px;
+    }
+    QFrame#card {
+        background: #ffffff;
+        border: 1px solid #e5e7eb;
+        border-radius: 12px;
+    }
+    QLabel#cardTitle {
+        font-size: 15px;
+        font-weight: 700;
+        color: #111827;
+    }
+    QLabel#cardDesc {
+        font-size: 12px;
+        color: #6b7280;
+    }
+    QGroupBox#resultsGroup {
+        border: 1px solid #e5e7eb;
+        border-radius: 12px;
+        background: #ffffff;
+    }
+    QGroupBox#resultsGroup::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 6px;
+        font-weight: 700;
+        color: #111827;
+    }
+    QLineEdit#inputField, QComboBox#inputField, QSpinBox#inputField, QDateEdit#inputField {
+        background: #ffffff;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #111827;
+        font-size: 18px;
+    }
+    QPushButton#primaryButtonWide {
+        background-color: #b91c1c;
+        color: #ffffff;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 18px;
+        font-weight: 700;
+    }
+    QPushButton#primaryButtonWide:hover {
+        background-color: #991b1b;
+    }
+    QPushButton#darkButtonWide {
+        background-color: #374151;
+        color: #ffffff;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 18px;
+        font-weight: 700;
+    }
+    QPushButton#darkButtonWide:hover {
+        background-color: #1f2937;
+    }
+    QWidget#footer {
+        background: #f3f4f6;
+        border-top: 1px solid #e5e7eb;
+    }
+    QLabel#status {
+        color: #6b7280;
+    }
+    QProgressBar#progress {
+        min-width: 180px;
+        max-width: 240px;
+        height: 18px;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        background: #ffffff;
+        text-align: center;
+        color: #374151;
+    }
+    QProgressBar#progress::chunk {
+        background-color: #b91c1c;
+        border-radius: 8px;
+    }
+    QListView#results {
+        border: none;
+        background: transparent;
+        font-size: 12px;
+        color: #6b7280;
+    }
+    QListView#results::item {
+        background: #f9fafb;
+        border: 1px solid #e5e7eb;
+        border-radius: 8px;
+        padding: 8px 10px;
+        margin-bottom: 8px;
+        color: #111827;
+    }
+    """)
+
 
 def _install_excepthook():
     def _hook(exc_type, exc_value, exc_traceback):
@@ -32,47 +217,83 @@ def _install_excepthook():
         pass
 
 
-class ExportWorker(QtCore.QObject):
+class ExportThread(QtCore.QThread):
     progress = QtCore.Signal(int, int, str, float)
-    finished = QtCore.Signal(list, list, float)
+    day_exported = QtCore.Signal(dict)
+    # QThread already has a no-argument finished signal.
+    # (exported, reused, failed, elapsed seconds)
+    export_finished = QtCore.Signal(int, int, int, float)
 
-    def __init__(self, dates):
-        super().__init__()
+    def __init__(self, dates, force=True, parent=None):
+        super().__init__(parent)
         self._dates = dates
+        self._force = force
 
-    @QtCore.Slot()
     def run(self):
         from .ipc_client import IpcClient
 
-        client = IpcClient()
-        exported_files = []
+        exported_count = 0
+        reused_count = 0
         failed_dates = []
         start = time.perf_counter()
+        total = len(self._dates)
+        batches = [
+            self._dates[offset:offset + _EXPORT_BATCH_SIZE]
+            for offset in range(0, total, _EXPORT_BATCH_SIZE)
+        ]
         try:
-            for index, date_str in enumerate(self._dates, start=1):
-                result = client.request("salesbook.export_daily", {"date": date_str})
-                if result.get("success"):
-                    file_path = result.get("file") or result.get("summary_file")
-                    if file_path:
-                        exported_files.append({
-                            "date": date_str,
-                            "file": file_path,
-                            "summary": result.get("summary_file", ""),
-                            "details": result.get("details_file"),
-                        })
-                else:
-                    error_text = result.get("error", "")
-                    if "No transactions" not in error_text and "No salesbook data" not in error_text:
-                        failed_dates.append(date_str)
-
-                elapsed = time.perf_counter() - start
-                self.progress.emit(index, len(self._dates), date_str, elapsed)
+            # One connection for the whole export. The pipeline holds the
+            # client's lock, so it must be closed before the client is.
+            with IpcClient() as client, closing(client.pipeline(
+                ("salesbook.export_batch", {"dates": batch, "force": self._force})
+                for batch in batches
+            )) as responses:
+                completed = 0
+                last_emit = start
+                for batch, response in zip(batches, responses):
+                    results = response.get("results")
+                    if results is None:
+                        # The whole request failed (IPC error, portal sync, ...).
+                        results = [{"date": date_str, **response} for date_str in batch]
+
+                    for result in results:
+                        date_str = result.get("date", "")
+                        if result.get("success"):
+                            summary_file = result.get("summary_file")
+                            file_path = result.get("file") or summary_file
+                            if file_path:
+                                file_info = {
+                                    "date": date_str,
+                                    "file": file_path,
+                                    "summary": summary_file or "",
+                                    "details": result.get("details_file"),
+                                    "reused": bool(result.get("reused")),
+                                }
+                                if file_info["reused"]:
+                                    reused_count += 1
+                                else:
+                                    exported_count += 1
+                                self.day_exported.emit(file_info)
+                        else:
+                            error_text = result.get("error", "")
+                            if not any(s in error_text for s in _NO_DATA_ERRORS):
+                                failed_dates.append(date_str)
+
+                    completed += len(batch)
+                    now = time.perf_counter()
+                    if completed == total or now - last_emit >= _PROGRESS_INTERVAL:
+                        last_emit = now
+                        self.progress.emit(completed, total, batch[-1], now - start)
         except Exception as exc:
             logger.error("Export worker crashed: %s", exc, exc_info=True)
             failed_dates.extend(self._dates)
 
+        if failed_dates:
+            logger.warning("Export failed for dates: %s", ", ".join(failed_dates))
+
+        # Results were already streamed via day_exported; only counts remain.
         total_elapsed = time.perf_counter() - start
-        self.finished.emit(exported_files, failed_dates, total_elapsed)
+        self.export_finished.emit(exported_count, reused_count, len(failed_dates), total_elapsed)
 
 
 def _show_error_messagebox(title, message):
@@ -83,43 +304,18 @@ def _show_error_messagebox(title, message):
         pass
 
 
-def _is_compiled() -> bool:
-    if "__compiled__" in dir():
-        return True
-    if getattr(sys, "frozen", False):
-        return True
-    if ".dist" in sys.executable:
-        return True
-    return False
-
-
-def _resolve_base_dir() -> str:
-    env_base = os.environ.get("BAB_UI_BASE")
-    if env_base:
-        return env_base.strip()
-    if _is_compiled():
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
 class ExportWindow(QtCore.QObject):
     def __init__(self, config):
         super().__init__()
         from PySide6.QtCore import Qt, QDate
-        from PySide6.QtGui import QIcon
+        from PySide6.QtGui import QIcon, QPixmap
         from PySide6.QtWidgets import (
             QMainWindow,
             QWidget,
             QVBoxLayout,
             QHBoxLayout,
-            QGridLayout,
             QLabel,
             QPushButton,
-            QDateEdit,
-            QComboBox,
-            QSpinBox,
-            QFrame,
-            QGroupBox,
             QScrollArea,
             QProgressBar,
         )
@@ -137,12 +333,16 @@ class ExportWindow(QtCore.QObject):
         self.window.resize(920, 720)
         self.window.setMinimumSize(820, 640)
 
-        base_dir = _resolve_base_dir()
+        base_dir = UI_BASE_DIR
         icon_path = os.path.join(base_dir, "src", "assets", "logo.png")
         arrow_down_path = os.path.join(base_dir, "src", "assets", "icons", "arrow_down.svg")
         arrow_up_path = os.path.join(base_dir, "src", "assets", "icons", "arrow_up.svg")
-        if os.path.exists(icon_path):
-            self.window.setWindowIcon(QIcon(icon_path))
+        # Decode logo.png once and reuse it for the window icon and header.
+        logo_pix = QPixmap(icon_path) if os.path.exists(icon_path) else None
+        if logo_pix is not None and logo_pix.isNull():
+            logo_pix = None
+        if logo_pix is not None:
+            self.window.setWindowIcon(QIcon(logo_pix))
 
         central = QWidget()
         self.window.setCentralWidget(central)
@@ -158,12 +358,8 @@ class ExportWindow(QtCore.QObject):
 
         logo = QLabel()
         logo.setObjectName("logo")
-        if os.path.exists(icon_path):
-            from PySide6.QtGui import QPixmap
-
-            pix = QPixmap(icon_path)
-            if not pix.isNull():
-                logo.setPixmap(pix.scaled(64, 64, self._Qt.KeepAspectRatio, self._Qt.SmoothTransformation))
+        if logo_pix is not None:
+            logo.setPixmap(logo_pix.scaled(64, 64, self._Qt.KeepAspectRatio, self._Qt.SmoothTransformation))
 
         title_box = QWidget()
         title_layout = QVBoxLayout(title_box)
@@ -198,6 +394,59 @@ class ExportWindow(QtCore.QObject):
         content_layout.setContentsMargins(20, 18, 20, 18)
         content_layout.setSpacing(16)
 
+        # The action cards and results panel are built on the next event-loop
+        # turn so the window frame (header and footer) shows first.
+        self._content_layout = content_layout
+
+        scroll.setWidget(content)
+        root_layout.addWidget(scroll, 1)
+
+        footer = QWidget()
+        footer.setObjectName("footer")
+        footer_layout = QHBoxLayout(footer)
+        footer_layout.setContentsMargins(16, 10, 16, 10)
+
+        self.status_label = QLabel("Ready")
+        self.status_label.setObjectName("status")
+        footer_layout.addWidget(self.status_label, 1)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("progress")
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setTextVisible(True)
+        footer_layout.addWidget(self.progress_bar, 0)
+
+        close_btn = QPushButton("Close")
+        close_btn.setObjectName("darkButtonWide")
+        close_btn.clicked.connect(self.window.close)
+        footer_layout.addWidget(close_btn)
+
+        root_layout.addWidget(footer)
+
+        self._apply_styles(arrow_down_path, arrow_up_path)
+        self._export_thread = None
+        self._avg_day_seconds = None
+        QtCore.QTimer.singleShot(0, self._build_body)
+
+    def _build_body(self):
+        from PySide6.QtWidgets import (
+            QWidget,
+            QVBoxLayout,
+            QHBoxLayout,
+            QGridLayout,
+            QLabel,
+            QPushButton,
+            QDateEdit,
+            QComboBox,
+            QSpinBox,
+            QFrame,
+            QGroupBox,
+            QCheckBox,
+            QListView,
+            QAbstractItemView,
+        )
+        from PySide6.QtGui import QStandardItem, QStandardItemModel
+
         actions_grid = QGridLayout()
         actions_grid.setSpacing(16)
 
@@ -218,7 +467,7 @@ class ExportWindow(QtCore.QObject):
         self.single_date.setObjectName("inputField")
         self.single_date.setDisplayFormat("dd-MM-yy")
         self.single_date.setCalendarPopup(True)
-        self.single_date.setDate(QDate.currentDate())
+        self.single_date.setDate(self._QDate.currentDate())
 
         date_btn = QPushButton("Export Date")
         date_btn.setObjectName("primaryButtonWide")
@@ -294,13 +543,13 @@ class ExportWindow(QtCore.QObject):
         self.range_start.setObjectName("inputField")
         self.range_start.setDisplayFormat("dd-MM-yy")
         self.range_start.setCalendarPopup(True)
-        self.range_start.setDate(QDate.currentDate())
+        self.range_start.setDate(self._QDate.currentDate())
 
         self.range_end = QDateEdit()
         self.range_end.setObjectName("inputField")
         self.range_end.setDisplayFormat("dd-MM-yy")
         self.range_end.setCalendarPopup(True)
-        self.range_end.setDate(QDate.currentDate())
+        self.range_end.setDate(self._QDate.currentDate())
 
         range_row_layout.addWidget(self.range_start, 1)
         range_row_layout.addWidget(self.range_end, 1)
@@ -318,7 +567,14 @@ class ExportWindow(QtCore.QObject):
         actions_grid.addWidget(date_card, 0, 0)
         actions_grid.addWidget(month_card, 0, 1)
         actions_grid.addWidget(range_card, 1, 0, 1, 2)
-        content_layout.addLayout(actions_grid)
+        self._content_layout.addLayout(actions_grid)
+
+        # Checked by default so a stale or corrupt file is rebuilt; unchecked,
+        # past days that already have a salesbook file are listed, not re-read.
+        self.regenerate_check = QCheckBox("Regenerate days that were already exported")
+        self.regenerate_check.setObjectName("regenerate")
+        self.regenerate_check.setChecked(True)
+        self._content_layout.addWidget(self.regenerate_check)
 
         results_group = QGroupBox("Export Results")
         results_group.setObjectName("resultsGroup")
@@ -326,49 +582,20 @@ class ExportWindow(QtCore.QObject):
         results_layout.setContentsMargins(22, 20, 22, 20)
         results_layout.setSpacing(12)
 
-        self.results_container = QWidget()
-        self.results_layout = QVBoxLayout(self.results_container)
-        self.results_layout.setContentsMargins(0, 0, 0, 0)
-        self.results_layout.setSpacing(8)
-
-        results_scroll = QScrollArea()
-        results_scroll.setWidgetResizable(True)
-        results_scroll.setWidget(self.results_container)
-        results_layout.addWidget(results_scroll)
+        # One model row per exported day; the view only paints visible rows.
+        self._QStandardItem = QStandardItem
+        self._results_model = QStandardItemModel(self)
+        self._results_view = QListView()
+        self._results_view.setObjectName("results")
+        self._results_view.setModel(self._results_model)
+        self._results_view.setUniformItemSizes(True)
+        self._results_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        results_layout.addWidget(self._results_view)
 
-        content_layout.addWidget(results_group)
-        content_layout.addStretch(1)
+        self._content_layout.addWidget(results_group)
+        self._content_layout.addStretch(1)
 
-        scroll.setWidget(content)
-        root_layout.addWidget(scroll, 1)
-
-        footer = QWidget()
-        footer.setObjectName("footer")
-        footer_layout = QHBoxLayout(footer)
-        footer_layout.setContentsMargins(16, 10, 16, 10)
-
-        self.status_label = QLabel("Ready")
-        self.status_label.setObjectName("status")
-        footer_layout.addWidget(self.status_label, 1)
-
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setObjectName("progress")
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setTextVisible(True)
-        footer_layout.addWidget(self.progress_bar, 0)
-
-        close_btn = QPushButton("Close")
-        close_btn.setObjectName("darkButtonWide")
-        close_btn.clicked.connect(self.window.close)
-        footer_layout.addWidget(close_btn)
-
-        root_layout.addWidget(footer)
-
-        self._apply_styles(arrow_down_path, arrow_up_path)
-        self._export_thread = None
-        self._export_worker = None
-        self._avg_day_seconds = None
-        QtCore.QTimer.singleShot(0, self._finalize_layout)
+        self._finalize_layout()
 
     def _finalize_layout(self):
         self.window.adjustSize()
@@ -377,180 +604,7 @@ class ExportWindow(QtCore.QObject):
     def _apply_styles(self, arrow_down_path, arrow_up_path):
         arrow_down_url = arrow_down_path.replace("\\", "/")
         arrow_up_url = arrow_up_path.replace("\\", "/")
-        style = """
-            QMainWindow {
-                background-color: #f5f6f8;
-                color: #111827;
-            }
-            QWidget#header {
-                background: #b91c1c;
-                border-bottom: 1px solid #991b1b;
-            }
-            QLabel#headerTitle {
-                font-size: 22px;
-                font-weight: 800;
-                color: #ffffff;
-                margin: 0;
-                padding: 0;
-                line-height: 22px;
-            }
-            QLabel#headerSubtitle {
-                font-size: 12px;
-                color: #f3d6d6;
-                margin: 0;
-                padding: 0;
-                line-height: 12px;
-            }
-            QComboBox#inputField, QDateEdit#inputField, QSpinBox#inputField {
-                padding-right: 24px;
-                font-size: 18px;
-            }
-            QComboBox#inputField::drop-down, QDateEdit#inputField::drop-down, QDateEdit::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 60px;
-                margin: 2px;
-                border: none;
-                background: #f3f4f6;
-                border-radius: 8px;
-            }
-            QComboBox#inputField::down-arrow, QDateEdit#inputField::down-arrow, QDateEdit::down-arrow {
-                image: url(__ARROW_DOWN__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center;
-            }
-            QSpinBox#inputField::up-button, QSpinBox#inputField::down-button {
-                subcontrol-origin: content;
-                subcontrol-position: center right;
-                width: 60px;
-                margin-top: 6px;
-                margin-bottom: 6px;
-                margin-right: 6px;
-                border: none;
-            }
-            QSpinBox#inputField::up-button {
-                background: transparent;
-                border-radius: 8px;
-            }
-            QSpinBox#inputField::down-button {
-                background: transparent;
-            }
-            QSpinBox#inputField::up-arrow {
-                image: url(__ARROW_UP__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center right;
-                right: 6px;
-            }
-            QSpinBox#inputField::down-arrow {
-                image: url(__ARROW_DOWN__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center right;
-                right: -12px;
-            }
-            QWidget#scroll {
-                background: transparent;
-            }
-            QLabel#logo {
-                background: #ffffff;
-                border-radius: 10px;
-                padding: 6px;
-            }
-            QFrame#card {
-                background: #ffffff;
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-            }
-            QLabel#cardTitle {
-                font-size: 15px;
-                font-weight: 700;
-                color: #111827;
-            }
-            QLabel#cardDesc {
-                font-size: 12px;
-                color: #6b7280;
-            }
-            QGroupBox#resultsGroup {
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-                background: #ffffff;
-            }
-            QGroupBox#resultsGroup::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 6px;
-                font-weight: 700;
-                color: #111827;
-            }
-            QLineEdit#inputField, QComboBox#inputField, QSpinBox#inputField, QDateEdit#inputField {
-                background: #ffffff;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #111827;
-                font-size: 18px;
-            }
-            QPushButton#primaryButtonWide {
-                background-color: #b91c1c;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 18px;
-                font-weight: 700;
-            }
-            QPushButton#primaryButtonWide:hover {
-                background-color: #991b1b;
-            }
-            QPushButton#darkButtonWide {
-                background-color: #374151;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 18px;
-                font-weight: 700;
-            }
-            QPushButton#darkButtonWide:hover {
-                background-color: #1f2937;
-            }
-            QWidget#footer {
-                background: #f3f4f6;
-                border-top: 1px solid #e5e7eb;
-            }
-            QLabel#status {
-                color: #6b7280;
-            }
-            QProgressBar#progress {
-                min-width: 180px;
-                max-width: 240px;
-                height: 18px;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                background: #ffffff;
-                text-align: center;
-                color: #374151;
-            }
-            QProgressBar#progress::chunk {
-                background-color: #b91c1c;
-                border-radius: 8px;
-            }
-            QWidget#resultItem {
-                background: #f9fafb;
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-            }
-            QLabel#resultDate {
-                font-weight: 700;
-                color: #111827;
-            }
-            QLabel#resultFile {
-                font-size: 12px;
-                color: #6b7280;
-            }
-            """
-        style = style.replace("__ARROW_DOWN__", arrow_down_url)
-        style = style.replace("__ARROW_UP__", arrow_up_url)
+        style = _STYLESHEET_TEMPLATE.substitute(arrow_down=arrow_down_url, arrow_up=arrow_up_url)
         self.window.setStyleSheet(style)
 
     def _set_status(self, message, is_error=False):
@@ -565,12 +619,15 @@ class ExportWindow(QtCore.QObject):
         self.month_btn.setEnabled(enabled)
         self.range_btn.setEnabled(enabled)
         self.open_folder_btn.setEnabled(enabled)
+        self.regenerate_check.setEnabled(enabled)
 
     def _start_worker(self, dates, label):
         if self._export_thread and self._export_thread.isRunning():
             self._set_status("Export already in progress...", is_error=True)
             return
 
+        self._clear_results()
+
         self._set_export_controls_enabled(False)
         self.progress_bar.setVisible(True)
 
@@ -586,14 +643,11 @@ class ExportWindow(QtCore.QObject):
         else:
             self._set_status(label)
 
-        self._export_thread = QtCore.QThread()
-        self._export_worker = ExportWorker(dates)
-        self._export_worker.moveToThread(self._export_thread)
-        self._export_thread.started.connect(self._export_worker.run)
-        self._export_worker.progress.connect(self._on_export_progress, QtCore.Qt.QueuedConnection)
-        self._export_worker.finished.connect(self._on_export_finished, QtCore.Qt.QueuedConnection)
-        self._export_worker.finished.connect(self._export_thread.quit)
-        self._export_worker.finished.connect(self._export_worker.deleteLater)
+        # Unchecked, the core keeps past days that already have a file.
+        self._export_thread = ExportThread(dates, self.regenerate_check.isChecked(), self)
+        self._export_thread.progress.connect(self._on_export_progress, QtCore.Qt.QueuedConnection)
+        self._export_thread.day_exported.connect(self._append_result, QtCore.Qt.QueuedConnection)
+        self._export_thread.export_finished.connect(self._on_export_finished, QtCore.Qt.QueuedConnection)
         self._export_thread.finished.connect(self._cleanup_export_thread)
         self._export_thread.finished.connect(self._export_thread.deleteLater)
         self._export_thread.start()
@@ -610,34 +664,34 @@ class ExportWindow(QtCore.QObject):
                 eta = f" ETA ~{self._format_eta(avg * remaining)}"
             self._set_status(f"Exporting {completed}/{total} (last {date_str}){eta}")
 
-    @QtCore.Slot(list, list, float)
-    def _on_export_finished(self, exported_files, failed_dates, elapsed):
-        self._finish_export_ui(exported_files, failed_dates, elapsed)
+    @QtCore.Slot(int, int, int, float)
+    def _on_export_finished(self, exported_count, reused_count, failed_count, elapsed):
+        self._finish_export_ui(exported_count, reused_count, failed_count, elapsed)
 
-    def _finish_export_ui(self, exported_files, failed_dates, elapsed):
+    def _finish_export_ui(self, exported_count, reused_count, failed_count, elapsed):
         try:
-            total = max(len(exported_files) + len(failed_dates), 1)
-            self._avg_day_seconds = elapsed / total
+            total = exported_count + failed_count
+            if total:
+                self._avg_day_seconds = elapsed / total
             self.progress_bar.setRange(0, 1)
             self.progress_bar.setValue(1)
             self.progress_bar.setVisible(False)
             self._set_export_controls_enabled(True)
 
-            if exported_files:
-                self._show_results(exported_files)
-                self._set_status(f"Exported {len(exported_files)} day(s)")
+            # Result cards were already added as each day was exported.
+            if exported_count or reused_count:
+                message = f"Exported {exported_count} day(s)"
+                if reused_count:
+                    message += f", {reused_count} already exported"
+                self._set_status(message)
             else:
                 self._set_status("No transactions found for the selected range", is_error=True)
-
-            if failed_dates:
-                logger.warning("Export failed for dates: %s", ", ".join(failed_dates))
         except Exception as exc:
             logger.error("Export completion failed: %s", exc, exc_info=True)
             self._set_status(str(exc), is_error=True)
 
     def _cleanup_export_thread(self):
         self._export_thread = None
-        self._export_worker = None
 
     @staticmethod
     def _format_eta(seconds):
@@ -645,57 +699,38 @@ class ExportWindow(QtCore.QObject):
         minutes, seconds = divmod(seconds, 60)
         return f"{minutes:02d}:{seconds:02d}"
     def _clear_results(self):
-        while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-
-    def _show_results(self, files):
-        from PySide6.QtWidgets import QVBoxLayout, QLabel, QWidget
-
-        self._clear_results()
-        if not files:
-            label = QLabel("No files exported")
-            label.setObjectName("resultFile")
-            self.results_layout.addWidget(label)
-            return
-
-        for file_info in files:
-            card = QWidget()
-            card.setObjectName("resultItem")
-            layout = QVBoxLayout(card)
-            layout.setContentsMargins(10, 8, 10, 8)
-            layout.setSpacing(4)
-
-            date_label = QLabel(file_info.get("date", ""))
-            date_label.setObjectName("resultDate")
-            layout.addWidget(date_label)
-
-            file_path = file_info.get("file")
-            if file_path:
-                file_label = QLabel(f"File: {file_path}")
-                file_label.setObjectName("resultFile")
-                layout.addWidget(file_label)
-            else:
-                summary_label = QLabel(f"Summary: {file_info.get('summary', '')}")
-                summary_label.setObjectName("resultFile")
-                layout.addWidget(summary_label)
-                details = file_info.get("details")
-                if details:
-                    details_label = QLabel(f"Details: {details}")
-                    details_label.setObjectName("resultFile")
-                    layout.addWidget(details_label)
+        self._results_model.clear()
+
+    @QtCore.Slot(dict)
+    def _append_result(self, file_info):
+        file_path = file_info.get("file")
+        date_label = file_info.get("date", "")
+        if file_info.get("reused"):
+            date_label += " (already exported)"
+        if file_path:
+            lines = [date_label, f"File: {file_path}"]
+        else:
+            lines = [date_label, f"Summary: {file_info.get('summary', '')}"]
+            details = file_info.get("details")
+            if details:
+                lines.append(f"Details: {details}")
 
-            self.results_layout.addWidget(card)
+        item = self._QStandardItem("\n".join(lines))
+        item.setToolTip(file_path or file_info.get("summary", ""))
+        self._results_model.appendRow(item)
 
     def export_by_date(self):
-        date_str = self.single_date.date().toString("yyyy-MM-dd")
+        date_str = self.single_date.date().toPython().isoformat()
         self._start_worker([date_str], f"Exporting salesbook for {date_str}...")
 
     def export_by_month(self):
-        year = int(self.year_select.value())
-        month = int(self.month_select.currentData())
+        # The spin box already bounds the year; the combo box carries 1-12 as item data
+        year = self.year_select.value()
+        month = self.month_select.currentData()
+        if month not in range(1, 13):
+            self._set_status("Select a month to export", is_error=True)
+            return
+
         today = datetime.date.today()
         if (year, month) > (today.year, today.month):
             self._set_status("Selected month is in the future", is_error=True)
@@ -706,32 +741,27 @@ class ExportWindow(QtCore.QObject):
         if (year, month) == (today.year, today.month):
             end_day = today.day
 
-        dates = [
-            datetime.date(year, month, day).strftime("%Y-%m-%d")
-            for day in range(1, end_day + 1)
-        ]
+        dates = [datetime.date(year, month, day).isoformat() for day in range(1, end_day + 1)]
         self._start_worker(dates, f"Exporting salesbook for {year}-{month:02d}...")
 
     def export_by_date_range(self):
-        start_date = self.range_start.date().toString("yyyy-MM-dd")
-        end_date = self.range_end.date().toString("yyyy-MM-dd")
+        start_date_obj = self.range_start.date().toPython()
+        end_date_obj = self.range_end.date().toPython()
 
-        if self.range_start.date() > self.range_end.date():
+        if start_date_obj > end_date_obj:
             self._set_status("Start date must be before end date", is_error=True)
             return
 
-        today = datetime.date.today()
-        end_date_obj = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        if end_date_obj > today:
-            end_date_obj = today
-            end_date = end_date_obj.strftime("%Y-%m-%d")
-
-        current_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        dates = []
-        while current_date <= end_date_obj:
-            dates.append(current_date.strftime("%Y-%m-%d"))
-            current_date += datetime.timedelta(days=1)
-        self._start_worker(dates, f"Exporting salesbook from {start_date} to {end_date}...")
+        end_date_obj = min(end_date_obj, datetime.date.today())
+        num_days = (end_date_obj - start_date_obj).days + 1
+        dates = [
+            (start_date_obj + datetime.timedelta(days=offset)).isoformat()
+            for offset in range(num_days)
+        ]
+        self._start_worker(
+            dates,
+            f"Exporting salesbook from {start_date_obj.isoformat()} to {end_date_obj.isoformat()}...",
+        )
 
     def open_export_folder(self):
         try:
@@ -4,17 +4,205 @@ Fiscal Tools UI using PySide6.
 Provides the same layout as the webview modal with a native Qt UI.
 """
 
-import datetime
 import logging
 import os
-import sys
 import ctypes
+from string import Template
 
 from PySide6 import QtCore, QtGui
+from PySide6.QtCore import Qt, QDate
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QGridLayout,
+    QLabel,
+    QPushButton,
+    QLineEdit,
+    QDateEdit,
+    QSpinBox,
+    QFrame,
+    QScrollArea,
+)
+
+from .ipc_client import IpcClient
+from .runtime_env import UI_BASE_DIR
 
 logger = logging.getLogger(__name__)
 
 
+# Window stylesheet; $arrow_down/$arrow_up are filled with the icon paths
+_STYLESHEET_TEMPLATE = Template("""
+    QMainWindow {
+        background-color: #f5f6f8;
+        color: #111827;
+    }
+    QWidget#header {
+        background: #b91c1c;
+        border-bottom: 1px solid #991b1b;
+    }
+    QLabel#headerTitle {
+        font-size: 22px;
+        font-weight: 800;
+        color: #ffffff;
+        margin: 0;
+        padding: 0;
+        line-height: 22px;
+    }
+    QLabel#headerSubtitle {
+        font-size: 12px;
+        color: #f3d6d6;
+        margin: 0;
+        padding: 0;
+        line-height: 12px;
+    }
+    QDateEdit#inputField, QSpinBox#inputField {
+        padding-right: 24px;
+        font-size: 18px;
+    }
+    QDateEdit#inputField::drop-down, QDateEdit::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 60px;
+        margin: 2px;
+        border: none;
+        background: #f3f4f6;
+        border-radius: 8px;
+    }
+    QDateEdit#inputField::down-arrow, QDateEdit::down-arrow {
+        image: url($arrow_down);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center;
+    }
+    QSpinBox#inputField::up-button, QSpinBox#inputField::down-button {
+        subcontrol-origin: content;
+        subcontrol-position: center right;
+        width: 60px;
+        margin-top: 6px;
+        margin-bottom: 6px;
+        margin-right: 6px;
+        border: none;
+    }
+    QSpinBox#inputField::up-button {
+        background: transparent;
+        border-radius: 8px;
+    }
+    QSpinBox#inputField::down-button {
+        background: transparent;
+    }
+    QSpinBox#inputField::up-arrow {
+        image: url($arrow_up);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center right;
+        right: 6px;
+    }
+    QSpinBox#inputField::down-arrow {
+        image: url($arrow_down);
+        width: 18px;
+        height: 18px;
+        subcontrol-position: center right;
+        right: -12px;
+    }
+    QLabel#sectionTitle {
+        font-size: 16px;
+        font-weight: 700;
+        color: #111827;
+        padding-left: 2px;
+    }
+    QWidget#actionCard {
+        background: #a6252a;
+        border: 1px solid #b33a3f;
+        border-radius: 10px;
+    }
+    QLabel#actionTitle {
+        font-size: 12px;
+        font-weight: 700;
+        color: #ffffff;
+    }
+    QWidget#scroll {
+        background: transparent;
+    }
+    QLabel#logo {
+        background: #ffffff;
+        border-radius: 10px;
+        padding: 6px;
+    }
+    QFrame#card, QFrame#cardRed, QFrame#cardGray {
+        background: #ffffff;
+        border: 1px solid #e5e7eb;
+        border-radius: 12px;
+    }
+    QFrame#cardRed {
+        background: #fff5f5;
+        border: 2px solid #ef4444;
+    }
+    QFrame#cardGray {
+        border: 2px solid #9ca3af;
+    }
+    QLabel#cardTitle {
+        font-size: 15px;
+        font-weight: 700;
+        color: #111827;
+    }
+    QLabel#cardDesc {
+        font-size: 12px;
+        color: #6b7280;
+    }
+    QLineEdit#inputField, QDateEdit#inputField, QSpinBox#inputField {
+        background: #ffffff;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #111827;
+    }
+    QPushButton#headerButton {
+        background-color: #ffffff;
+        color: #b91c1c;
+        border: 1px solid #fecaca;
+        border-radius: 8px;
+        padding: 6px 14px;
+        font-weight: 700;
+    }
+    QPushButton#headerButton:hover {
+        background-color: #fef2f2;
+    }
+    QPushButton#primaryButtonWide {
+        background-color: #b91c1c;
+        color: #ffffff;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 18px;
+        font-weight: 700;
+    }
+    QPushButton#primaryButtonWide:hover {
+        background-color: #991b1b;
+    }
+    QPushButton#darkButtonWide {
+        background-color: #374151;
+        color: #ffffff;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 18px;
+        font-weight: 700;
+    }
+    QPushButton#darkButtonWide:hover {
+        background-color: #1f2937;
+    }
+    QWidget#footer {
+        background: #f3f4f6;
+        border-top: 1px solid #e5e7eb;
+    }
+    QLabel#status {
+        color: #6b7280;
+    }
+""")
+
+
 def _show_error_messagebox(title, message):
     """Show native Windows error dialog for debugging modal failures."""
     try:
@@ -23,64 +211,39 @@ def _show_error_messagebox(title, message):
         pass
 
 
-def _is_compiled() -> bool:
-    if "__compiled__" in dir():
-        return True
-    if getattr(sys, "frozen", False):
-        return True
-    if ".dist" in sys.executable:
-        return True
-    return False
+# Qt platform plugins that render nothing on screen
+_HEADLESS_PLATFORMS = ("offscreen", "minimal")
 
+# The arrow icon paths depend only on UI_BASE_DIR, so the stylesheet is filled
+# in once here; Qt wants forward slashes in url().
+_ICONS_DIR = os.path.join(UI_BASE_DIR, "src", "assets", "icons").replace("\\", "/")
+_STYLESHEET = _STYLESHEET_TEMPLATE.substitute(
+    arrow_down=f"{_ICONS_DIR}/arrow_down.svg",
+    arrow_up=f"{_ICONS_DIR}/arrow_up.svg",
+)
 
-def _resolve_base_dir() -> str:
-    env_base = os.environ.get("BAB_UI_BASE")
-    if env_base:
-        return env_base.strip()
-    if _is_compiled():
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-
-class FiscalToolsWindow:
+class FiscalToolsWindow(QMainWindow):
     def __init__(self):
-        from PySide6.QtCore import Qt, QDate
-        from PySide6.QtGui import QIcon
-        from PySide6.QtWidgets import (
-            QMainWindow,
-            QWidget,
-            QVBoxLayout,
-            QHBoxLayout,
-            QGridLayout,
-            QLabel,
-            QPushButton,
-            QLineEdit,
-            QDateEdit,
-            QSpinBox,
-            QFrame,
-            QScrollArea,
-        )
-
-        from .ipc_client import IpcClient
-
-        self._Qt = Qt
-        self._QDate = QDate
+        super().__init__()
         self.client = IpcClient()
 
-        self.window = QMainWindow()
-        self.window.setWindowTitle("BAB Cloud - Fiscal Tools")
-        self.window.resize(920, 700)
-        self.window.setMinimumSize(800, 600)
+        self.setWindowTitle("BAB Cloud - Fiscal Tools")
+        self.resize(920, 700)
+        self.setMinimumSize(800, 600)
 
-        base_dir = _resolve_base_dir()
-        icon_path = os.path.join(base_dir, "src", "assets", "logo.png")
-        arrow_down_path = os.path.join(base_dir, "src", "assets", "icons", "arrow_down.svg")
-        arrow_up_path = os.path.join(base_dir, "src", "assets", "icons", "arrow_up.svg")
-        if os.path.exists(icon_path):
-            self.window.setWindowIcon(QIcon(icon_path))
+        # Decode logo.png once and reuse it for the window icon and header.
+        # A missing file yields a null pixmap, so no separate exists() check.
+        # Headless platforms (automation) never show either, so skip the decode.
+        if QtGui.QGuiApplication.platformName() in _HEADLESS_PLATFORMS:
+            logo_pix = QPixmap()
+        else:
+            logo_pix = QPixmap(os.path.join(UI_BASE_DIR, "src", "assets", "logo.png"))
+        if not logo_pix.isNull():
+            self.setWindowIcon(QIcon(logo_pix))
 
         central = QWidget()
-        self.window.setCentralWidget(central)
+        self.setCentralWidget(central)
         root_layout = QVBoxLayout(central)
         root_layout.setContentsMargins(0, 0, 0, 0)
         root_layout.setSpacing(0)
@@ -93,12 +256,8 @@ class FiscalToolsWindow:
 
         logo = QLabel()
         logo.setObjectName("logo")
-        if os.path.exists(icon_path):
-            from PySide6.QtGui import QPixmap
-
-            pix = QPixmap(icon_path)
-            if not pix.isNull():
-                logo.setPixmap(pix.scaled(72, 72, self._Qt.KeepAspectRatio, self._Qt.SmoothTransformation))
+        if not logo_pix.isNull():
+            logo.setPixmap(logo_pix.scaled(72, 72, Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
         title_box = QWidget()
         title_layout = QVBoxLayout(title_box)
@@ -111,9 +270,9 @@ class FiscalToolsWindow:
         title_layout.addWidget(title)
         title_layout.addWidget(subtitle)
         title_layout.setSpacing(4)
-        title_layout.setAlignment(self._Qt.AlignVCenter)
+        title_layout.setAlignment(Qt.AlignVCenter)
 
-        header_layout.setAlignment(self._Qt.AlignVCenter)
+        header_layout.setAlignment(Qt.AlignVCenter)
         header_layout.addWidget(logo)
         header_layout.addWidget(title_box, 1)
 
@@ -152,6 +311,44 @@ class FiscalToolsWindow:
         content_layout.setContentsMargins(20, 18, 20, 18)
         content_layout.setSpacing(18)
 
+        # The report cards are built on the next event-loop turn so the
+        # window frame (header and footer) shows first.
+        self._content_layout = content_layout
+
+        scroll.setWidget(content)
+        root_layout.addWidget(scroll, 1)
+
+        footer = QWidget()
+        footer.setObjectName("footer")
+        footer_layout = QHBoxLayout(footer)
+        footer_layout.setContentsMargins(16, 10, 16, 10)
+
+        self.status_label = QLabel("Ready")
+        self.status_label.setObjectName("status")
+        self._status_is_error = False
+        footer_layout.addWidget(self.status_label, 1)
+
+        close_btn = QPushButton("Close")
+        close_btn.setObjectName("darkButtonWide")
+        close_btn.clicked.connect(self.close)
+        footer_layout.addWidget(close_btn)
+
+        root_layout.addWidget(footer)
+
+        self._apply_styles()
+        self._body_built = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Build the body once, after the first show has been handled, so the
+        # header and footer are painted before the cards and the final resize.
+        if not self._body_built:
+            self._body_built = True
+            QtCore.QTimer.singleShot(0, self._build_body)
+
+    def _build_body(self):
+        content_layout = self._content_layout
+
         today_label = QLabel("Today's Reports")
         today_label.setObjectName("sectionTitle")
         content_layout.addWidget(today_label)
@@ -193,232 +390,22 @@ class FiscalToolsWindow:
         content_layout.addLayout(history_grid)
 
         content_layout.addStretch(1)
-        scroll.setWidget(content)
-        root_layout.addWidget(scroll, 1)
-
-        footer = QWidget()
-        footer.setObjectName("footer")
-        footer_layout = QHBoxLayout(footer)
-        footer_layout.setContentsMargins(16, 10, 16, 10)
-
-        self.status_label = QLabel("Ready")
-        self.status_label.setObjectName("status")
-        footer_layout.addWidget(self.status_label, 1)
-
-        close_btn = QPushButton("Close")
-        close_btn.setObjectName("darkButtonWide")
-        close_btn.clicked.connect(self.window.close)
-        footer_layout.addWidget(close_btn)
-
-        root_layout.addWidget(footer)
-
-        self._apply_styles(arrow_down_path, arrow_up_path)
-        self._init_dates()
-        QtCore.QTimer.singleShot(0, self._finalize_layout)
+        self._finalize_layout()
 
     def _finalize_layout(self):
-        self.window.adjustSize()
+        self.adjustSize()
         screen = QtGui.QGuiApplication.primaryScreen()
         if screen:
             max_height = max(480, screen.availableGeometry().height() - 40)
-            target_height = min(self.window.sizeHint().height(), max_height)
-            self.window.setMaximumHeight(target_height)
-            if self.window.height() > target_height:
-                self.window.resize(self.window.width(), target_height)
-
-    def _apply_styles(self, arrow_down_path, arrow_up_path):
-        arrow_down_url = arrow_down_path.replace("\\", "/")
-        arrow_up_url = arrow_up_path.replace("\\", "/")
-        style = """
-            QMainWindow {
-                background-color: #f5f6f8;
-                color: #111827;
-            }
-            QWidget#header {
-                background: #b91c1c;
-                border-bottom: 1px solid #991b1b;
-            }
-            QLabel#headerTitle {
-                font-size: 22px;
-                font-weight: 800;
-                color: #ffffff;
-                margin: 0;
-                padding: 0;
-                line-height: 22px;
-            }
-            QLabel#headerSubtitle {
-                font-size: 12px;
-                color: #f3d6d6;
-                margin: 0;
-                padding: 0;
-                line-height: 12px;
-            }
-            QDateEdit#inputField, QSpinBox#inputField {
-                padding-right: 24px;
-                font-size: 18px;
-            }
-            QDateEdit#inputField::drop-down, QDateEdit::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 60px;
-                margin: 2px;
-                border: none;
-                background: #f3f4f6;
-                border-radius: 8px;
-            }
-            QDateEdit#inputField::down-arrow, QDateEdit::down-arrow {
-                image: url(__ARROW_DOWN__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center;
-            }
-            QSpinBox#inputField::up-button, QSpinBox#inputField::down-button {
-                subcontrol-origin: content;
-                subcontrol-position: center right;
-                width: 60px;
-                margin-top: 6px;
-                margin-bottom: 6px;
-                margin-right: 6px;
-                border: none;
-            }
-            QSpinBox#inputField::up-button {
-                background: transparent;
-                border-radius: 8px;
-            }
-            QSpinBox#inputField::down-button {
-                background: transparent;
-            }
-            QSpinBox#inputField::up-arrow {
-                image: url(__ARROW_UP__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center right;
-                right: 6px;
-            }
-            QSpinBox#inputField::down-arrow {
-                image: url(__ARROW_DOWN__);
-                width: 18px;
-                height: 18px;
-                subcontrol-position: center right;
-                right: -12px;
-            }
-            QLabel#sectionTitle {
-                font-size: 16px;
-                font-weight: 700;
-                color: #111827;
-                padding-left: 2px;
-            }
-            QWidget#actionCard {
-                background: #a6252a;
-                border: 1px solid #b33a3f;
-                border-radius: 10px;
-            }
-            QLabel#actionTitle {
-                font-size: 12px;
-                font-weight: 700;
-                color: #ffffff;
-            }
-            QWidget#scroll {
-                background: transparent;
-            }
-            QLabel#logo {
-                background: #ffffff;
-                border-radius: 10px;
-                padding: 6px;
-            }
-            QFrame#card {
-                background: #ffffff;
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-            }
-            QFrame#cardRed {
-                background: #fff5f5;
-                border: 2px solid #ef4444;
-                border-radius: 12px;
-            }
-            QFrame#cardGray {
-                background: #ffffff;
-                border: 2px solid #9ca3af;
-                border-radius: 12px;
-            }
-            QLabel#cardTitle {
-                font-size: 15px;
-                font-weight: 700;
-                color: #111827;
-            }
-            QLabel#cardDesc {
-                font-size: 12px;
-                color: #6b7280;
-            }
-            QLineEdit#inputField {
-                background: #ffffff;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #111827;
-            }
-            QDateEdit#inputField {
-                background: #ffffff;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #111827;
-            }
-            QSpinBox#inputField {
-                background: #ffffff;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #111827;
-            }
-            QPushButton#headerButton {
-                background-color: #ffffff;
-                color: #b91c1c;
-                border: 1px solid #fecaca;
-                border-radius: 8px;
-                padding: 6px 14px;
-                font-weight: 700;
-            }
-            QPushButton#headerButton:hover {
-                background-color: #fef2f2;
-            }
-            QPushButton#primaryButtonWide {
-                background-color: #b91c1c;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 18px;
-                font-weight: 700;
-            }
-            QPushButton#primaryButtonWide:hover {
-                background-color: #991b1b;
-            }
-            QPushButton#darkButtonWide {
-                background-color: #374151;
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 18px;
-                font-weight: 700;
-            }
-            QPushButton#darkButtonWide:hover {
-                background-color: #1f2937;
-            }
-            QWidget#footer {
-                background: #f3f4f6;
-                border-top: 1px solid #e5e7eb;
-            }
-            QLabel#status {
-                color: #6b7280;
-            }
-            """
-        style = style.replace("__ARROW_DOWN__", arrow_down_url)
-        style = style.replace("__ARROW_UP__", arrow_up_url)
-        self.window.setStyleSheet(style)
+            target_height = min(self.sizeHint().height(), max_height)
+            self.setMaximumHeight(target_height)
+            if self.height() > target_height:
+                self.resize(self.width(), target_height)
 
-    def _build_action_card(self, title, widgets):
-        from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QWidget
+    def _apply_styles(self):
+        self.setStyleSheet(_STYLESHEET)
 
+    def _build_action_card(self, title, widgets):
         card = QWidget()
         card.setObjectName("actionCard")
         layout = QVBoxLayout(card)
@@ -439,8 +426,6 @@ class FiscalToolsWindow:
         return card
 
     def _build_report_card(self, title, description, button_text, button_object, handler, accent):
-        from PySide6.QtWidgets import QVBoxLayout, QLabel, QPushButton, QFrame
-
         frame = QFrame()
         if accent == "red":
             frame.setObjectName("cardRed")
@@ -469,9 +454,6 @@ class FiscalToolsWindow:
         return frame
 
     def _build_date_range_card(self):
-        from PySide6.QtWidgets import QVBoxLayout, QLabel, QGridLayout, QPushButton, QFrame, QDateEdit
-        from PySide6.QtCore import QDate
-
         frame = QFrame()
         frame.setObjectName("card")
         layout = QVBoxLayout(frame)
@@ -511,8 +493,6 @@ class FiscalToolsWindow:
         return frame
 
     def _build_number_range_card(self):
-        from PySide6.QtWidgets import QVBoxLayout, QLabel, QGridLayout, QPushButton, QSpinBox, QFrame
-
         frame = QFrame()
         frame.setObjectName("card")
         layout = QVBoxLayout(frame)
@@ -549,17 +529,13 @@ class FiscalToolsWindow:
         layout.addWidget(btn)
         return frame
 
-    def _init_dates(self):
-        today = self._QDate.currentDate()
-        self.date_start.setDate(today)
-        self.date_end.setDate(today)
-
     def _set_status(self, message, is_error=False):
         self.status_label.setText(message)
-        if is_error:
-            self.status_label.setStyleSheet("color: #dc2626;")
-        else:
-            self.status_label.setStyleSheet("color: #6b7280;")
+        # Only re-style on an error/ok switch; each setStyleSheet re-parses.
+        # A palette would not work here: the window stylesheet sets the colour.
+        if is_error != self._status_is_error:
+            self._status_is_error = is_error
+            self.status_label.setStyleSheet("color: #dc2626;" if is_error else "color: #6b7280;")
 
     def _call(self, action, payload=None):
         return self.client.request(action, payload or {})
@@ -589,8 +565,9 @@ class FiscalToolsWindow:
         self._handle_result(result, result.get("message", "Z Reports printed"))
 
     def print_z_report_by_number_range(self):
-        start_number = int(self.start_number.value())
-        end_number = int(self.end_number.value())
+        # QSpinBox.value() already returns an int
+        start_number = self.start_number.value()
+        end_number = self.end_number.value()
         self._set_status(f"Printing Z Reports #{start_number} to #{end_number}...")
         result = self._call(
             "fiscal.print_z_report_by_number_range",
@@ -619,18 +596,20 @@ class FiscalToolsWindow:
 
 
 def _open_fiscal_tools_modal_original(config):
+    # The import of PySide6 itself happens at module load; what can still fail
+    # here is Qt start-up (e.g. a missing platform plugin), before any window
+    # exists to report it in.
     try:
-        from PySide6.QtWidgets import QApplication
+        app = QApplication.instance()
+        if app is None:
+            app = QApplication([])
+
+        window = FiscalToolsWindow()
     except Exception as exc:
-        _show_error_messagebox("Fiscal Tools Error", f"PySide6 is not available: {exc}")
+        _show_error_messagebox("Fiscal Tools Error", f"Could not start Fiscal Tools: {exc}")
         raise
 
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-
-    window = FiscalToolsWindow()
-    window.window.show()
+    window.show()
     app.exec()
 
 
@@ -4,11 +4,10 @@ Named-pipe IPC client for UI -> Core requests.
 
 from __future__ import annotations
 
-import base64
 import logging
 import os
 import threading
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 
 from multiprocessing.connection import Client
 
@@ -22,6 +21,8 @@ def _decode_auth_key(value: str) -> Optional[bytes]:
         return bytes.fromhex(value)
     except ValueError:
         try:
+            import base64
+
             return base64.b64decode(value)
         except Exception:
             return None
@@ -36,27 +37,114 @@ class IpcClient:
         self._lock = threading.Lock()
         self._conn = None
 
+    def _connect(self) -> Optional[Dict[str, Any]]:
+        """Open the connection if needed; returns an error response on failure."""
+        if self._conn is None:
+            try:
+                self._conn = Client(self.pipe_name, authkey=self.auth_key)
+            except Exception as exc:
+                logger.error("IPC connection failed: %s", exc)
+                self._conn = None
+                return {"success": False, "error": f"IPC connection failed: {exc}"}
+        return None
+
+    def _drop_connection(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+    def _send(self, message: Dict[str, Any], fresh: bool) -> None:
+        """Send on the current connection, reconnecting once if a reused one is stale.
+
+        Only a failed send is retried: the core never saw the message, so
+        resending cannot run an action twice.
+        """
+        try:
+            self._conn.send(message)
+        except Exception as exc:
+            if fresh:
+                raise
+            logger.warning("IPC connection lost (%s), reconnecting", exc)
+            self._drop_connection()
+            self._conn = Client(self.pipe_name, authkey=self.auth_key)
+            self._conn.send(message)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._drop_connection()
+
+    def __enter__(self) -> "IpcClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def request(self, action: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         if not self.pipe_name or not self.auth_key:
             return {"success": False, "error": "IPC is not configured"}
 
         with self._lock:
-            if self._conn is None:
-                try:
-                    self._conn = Client(self.pipe_name, authkey=self.auth_key)
-                except Exception as exc:
-                    logger.error("IPC connection failed: %s", exc)
-                    self._conn = None
-                    return {"success": False, "error": f"IPC connection failed: {exc}"}
+            fresh = self._conn is None
+            error = self._connect()
+            if error:
+                return error
 
             try:
-                self._conn.send({"action": action, "payload": payload or {}})
+                self._send({"action": action, "payload": payload or {}}, fresh)
                 return self._conn.recv()
             except Exception as exc:
                 logger.error("IPC request failed: %s", exc)
-                try:
-                    self._conn.close()
-                except Exception:
-                    pass
-                self._conn = None
+                self._drop_connection()
                 return {"success": False, "error": f"IPC request failed: {exc}"}
+
+    def pipeline(
+        self,
+        requests: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+        window: int = 2,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield responses to (action, payload) requests in order.
+
+        Up to ``window`` requests are kept in flight so the core can start on
+        the next one while the previous response is being handled. The server
+        answers each connection in order, so responses line up with requests.
+        The connection is held until the generator is exhausted or closed.
+        """
+        requests = list(requests)
+        if not self.pipe_name or not self.auth_key:
+            for _ in requests:
+                yield {"success": False, "error": "IPC is not configured"}
+            return
+
+        with self._lock:
+            fresh = self._conn is None
+            error = self._connect()
+            if error:
+                for _ in requests:
+                    yield error
+                return
+
+            sent = received = 0
+            try:
+                while received < len(requests):
+                    while sent < len(requests) and sent - received < max(1, window):
+                        action, payload = requests[sent]
+                        # Only the first send can hit a stale reused connection.
+                        self._send({"action": action, "payload": payload or {}}, fresh or sent > 0)
+                        sent += 1
+                    response = self._conn.recv()
+                    received += 1
+                    yield response
+            except Exception as exc:
+                logger.error("IPC pipeline failed: %s", exc)
+                self._drop_connection()
+                error = {"success": False, "error": f"IPC request failed: {exc}"}
+                while received < len(requests):
+                    received += 1
+                    yield error
+            finally:
+                # Abandoned mid-stream: unread responses would desync the next request.
+                if self._conn is not None and received < sent:
+                    self._drop_connection()
@@ -23,6 +23,8 @@ class CoreCommandHandler:
 
     def __init__(self, config: Dict[str, Any], printer, software) -> None:
         self.config = config
+        # Live reference into config; nothing replaces the section wholesale
+        self._fiscal_tools = config.setdefault("fiscal_tools", {})
         self.printer = printer
         self.software = software
         self._lock = threading.Lock()
@@ -141,9 +143,9 @@ class CoreCommandHandler:
                 if action == "fiscal.print_no_sale":
                     return self._print_no_sale(payload)
                 if action == "fiscal.get_config":
-                    return {"success": True, "config": self.config.get("fiscal_tools", {})}
+                    return {"success": True, "config": self._fiscal_tools}
                 if action == "fiscal.get_min_date":
-                    value = self.config.get("fiscal_tools", {}).get(
+                    value = self._fiscal_tools.get(
                         "Z_report_from",
                         datetime.date.today().strftime("%Y-%m-%d"),
                     )
@@ -162,6 +164,8 @@ class CoreCommandHandler:
             try:
                 if action == "salesbook.export_daily":
                     return self._export_salesbook_daily(payload)
+                if action == "salesbook.export_batch":
+                    return self._export_salesbook_batch(payload)
             except Exception as exc:
                 logger.error("IPC salesbook action failed: %s", exc, exc_info=True)
                 return {"success": False, "error": str(exc)}
@@ -175,12 +179,8 @@ class CoreCommandHandler:
         if not date_str:
             return {"success": False, "error": "Date is required (YYYY-MM-DD)"}
 
-        from src.salesbook import SalesBookGenerator
-        from src.core.config_manager import get_config_path
-
         logger.info("IPC: Salesbook export requested for %s", date_str)
-        generator = SalesBookGenerator(self.printer, config_path=get_config_path())
-        file_path = generator.generate_daily_csv(date_str)
+        file_path = self._salesbook_generator().generate_daily_csv(date_str)
 
         if not file_path:
             return {"success": False, "error": f"No salesbook data for {date_str}"}
@@ -191,6 +191,61 @@ class CoreCommandHandler:
             "message": f"Salesbook exported for {date_str}",
         }
 
+    def _salesbook_generator(self):
+        from src.salesbook import SalesBookGenerator
+        from src.core.config_manager import get_config_path
+
+        return SalesBookGenerator(self.printer, config_path=get_config_path())
+
+    def _export_salesbook_batch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Export several days in one request; results are returned per date.
+
+        Every date is regenerated unless the payload sets "force" to False; then
+        past days that already have a daily file are reported as reused.
+        """
+        if self._portal_sync_required():
+            return self._portal_sync_error()
+        dates = payload.get("dates")
+        if not dates:
+            return {"success": False, "error": "Dates are required (YYYY-MM-DD)"}
+
+        logger.info("IPC: Salesbook batch export requested for %d date(s)", len(dates))
+        generator = self._salesbook_generator()
+
+        reused = {}
+        pending = dates
+        if not payload.get("force", True):
+            # A closed fiscal day no longer changes; today is always regenerated.
+            today = datetime.date.today().isoformat()
+            for date_str in dates:
+                existing = generator.existing_daily_csv(date_str) if date_str < today else None
+                if existing:
+                    reused[date_str] = existing
+            pending = [date_str for date_str in dates if date_str not in reused]
+
+        # One Z report read covers the whole batch; transactions and files are per day.
+        file_paths = generator.generate_daily_csvs(pending) if pending else {}
+        results = []
+        for date_str in dates:
+            if date_str in reused:
+                result = {
+                    "success": True,
+                    "file": reused[date_str],
+                    "reused": True,
+                    "message": f"Salesbook already exported for {date_str}",
+                }
+            elif file_paths.get(date_str):
+                result = {
+                    "success": True,
+                    "file": file_paths[date_str],
+                    "message": f"Salesbook exported for {date_str}",
+                }
+            else:
+                result = {"success": False, "error": f"No salesbook data for {date_str}"}
+            results.append({"date": date_str, **result})
+
+        return {"success": True, "results": results}
+
     def _print_x_report(self) -> Dict[str, Any]:
         logger.info("IPC: X-Report requested")
         if self._portal_sync_required():
@@ -233,7 +288,7 @@ class CoreCommandHandler:
                 return {"success": False, "error": "Cloud-only license requires portal connection"}
 
         now = datetime.datetime.now()
-        self.config.setdefault("fiscal_tools", {})["last_z_report_print_time"] = now.isoformat()
+        self._fiscal_tools["last_z_report_print_time"] = now.isoformat()
         save_config(self.config)
 
         response = self.printer.print_z_report(close_fiscal_day=True)
@@ -270,8 +325,8 @@ class CoreCommandHandler:
             elif self._cloud_policy_enabled() and not self._within_cloud_grace():
                 return {"success": False, "error": "Cloud-only license requires portal connection"}
 
-        start_date_obj = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        end_date_obj = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        start_date_obj = datetime.date.fromisoformat(start_date)
+        end_date_obj = datetime.date.fromisoformat(end_date)
         response = self.printer.print_z_report_by_date(start_date_obj, end_date_obj)
         if response.get("success"):
             return {"success": True, "message": response.get("message", "Z Reports printed")}
@@ -377,7 +432,7 @@ class CoreCommandHandler:
         return {"success": False, "error": response.get("error", "Failed to print No Sale")}
 
     def _get_z_report_config(self) -> Dict[str, Any]:
-        fiscal_tools = self.config.get("fiscal_tools", {})
+        fiscal_tools = self._fiscal_tools
         today = datetime.date.today()
         yesterday = (today - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
         last_print_time = fiscal_tools.get("last_z_report_print_time")
@@ -9,6 +9,8 @@ import sys
 import logging
 import ctypes
 
+from src.core.runtime_env import UI_BASE_DIR
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,26 +22,6 @@ def _show_error_messagebox(title, message):
         pass
 
 
-def _is_compiled():
-    """Check if running as compiled executable (Nuitka or PyInstaller)."""
-    if '__compiled__' in dir():
-        return True
-    if getattr(sys, 'frozen', False):
-        return True
-    if '.dist' in sys.executable:
-        return True
-    return False
-
-
-def _resolve_base_dir():
-    env_base = os.environ.get("BAB_UI_BASE")
-    if env_base:
-        return env_base
-    if _is_compiled():
-        return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
 class LogViewerWindow:
     """PySide6 log viewer window."""
 
@@ -305,7 +287,7 @@ def _run_log_viewer_standalone(config):
     """
     logger.info("[LOG_VIEWER] _run_log_viewer_standalone called")
 
-    base_dir = _resolve_base_dir()
+    base_dir = UI_BASE_DIR
     icon_path = os.path.join(base_dir, 'src', 'assets', 'logo.png')
     log_file_path = os.path.join(base_dir, 'log.log')
     logger.info("[LOG_VIEWER] base_dir: %s", base_dir)
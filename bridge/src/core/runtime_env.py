@@ -0,0 +1,42 @@
+"""
+Runtime environment shared by the core launcher and the UI modals.
+
+Resolved once at import: whether this is a compiled build, and the base
+directory the modals load their assets and config from.
+"""
+
+import os
+import sys
+
+
+def _is_compiled() -> bool:
+    """Check if running as compiled executable (Nuitka or PyInstaller)."""
+    # PyInstaller sets sys.frozen
+    if getattr(sys, "frozen", False):
+        return True
+    # Nuitka sets __compiled__ at module level (dir() here would only list locals)
+    if "__compiled__" in globals():
+        return True
+    # Nuitka standalone builds run from a *.dist folder
+    if ".dist" in sys.executable:
+        return True
+    # Check if executable ends with .exe and is not python.exe/pythonw.exe
+    if sys.executable.lower().endswith(".exe"):
+        exe_name = os.path.basename(sys.executable).lower()
+        if exe_name not in ("python.exe", "pythonw.exe", "python3.exe", "python313.exe"):
+            return True
+    return False
+
+
+IS_COMPILED = _is_compiled()
+
+# Directory next to the executable (compiled) or the bridge folder (source):
+# core -> src -> bridge
+INSTALL_DIR = (
+    os.path.dirname(sys.executable)
+    if IS_COMPILED
+    else os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+# Modals prefer BAB_UI_BASE, which the launcher sets before starting them
+UI_BASE_DIR = os.environ.get("BAB_UI_BASE", "").strip() or INSTALL_DIR
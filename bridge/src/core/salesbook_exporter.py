@@ -10,11 +10,16 @@ import json
 import csv
 import datetime
 import logging
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for CSV files; rows are also handed to the csv writer in batches
+_CSV_BUFFER_SIZE = 1024 * 1024
+_DEFAULT_CSV_BATCH_SIZE = 10000
+
 
 class SalesbookExporter:
     """
@@ -42,6 +47,7 @@ class SalesbookExporter:
         self.export_path = salesbook_config.get('csv_export_path', 'C:\\Fbook')
         self.auto_export = salesbook_config.get('auto_export_on_z_report', True)
         self.include_details = salesbook_config.get('include_transaction_details', True)
+        self.csv_batch_size = self._parse_csv_batch_size(salesbook_config.get('csv_batch_size'))
 
         # Get base directory for transactions
         from .config_manager import get_base_dir
@@ -50,6 +56,22 @@ class SalesbookExporter:
 
         logger.info(f"Salesbook exporter initialized: enabled={self.enabled}, path={self.export_path}")
 
+    @staticmethod
+    def _parse_csv_batch_size(value: Any) -> int:
+        """Return a positive CSV batch size, falling back to the default if unset or invalid."""
+        if value is None:
+            return _DEFAULT_CSV_BATCH_SIZE
+        try:
+            batch_size = int(value)
+        except (TypeError, ValueError):
+            batch_size = 0
+        if batch_size < 1:
+            logger.warning(
+                f"Invalid salesbook.csv_batch_size {value!r}, using {_DEFAULT_CSV_BATCH_SIZE}"
+            )
+            return _DEFAULT_CSV_BATCH_SIZE
+        return batch_size
+
     def ensure_export_directory(self) -> bool:
         """
         Ensure the export directory exists, create if needed.
@@ -104,7 +126,11 @@ class SalesbookExporter:
             logger.error(f"Error reading transaction files: {e}")
             return transactions
 
-    def export_transactions_summary(self, date: Optional[datetime.date] = None) -> Optional[str]:
+    def export_transactions_summary(
+        self,
+        date: Optional[datetime.date] = None,
+        transactions: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[str]:
         """
         Export daily transaction summary to CSV.
 
@@ -112,6 +138,7 @@ class SalesbookExporter:
 
         Args:
             date: Date to export (defaults to today)
+            transactions: Transactions already read for the date (read if omitted)
 
         Returns:
             str: Path to created CSV file, or None if failed
@@ -127,7 +154,8 @@ class SalesbookExporter:
             date = datetime.date.today()
 
         date_str = date.strftime('%Y-%m-%d')
-        transactions = self.read_transaction_files(date)
+        if transactions is None:
+            transactions = self.read_transaction_files(date)
 
         if not transactions:
             logger.warning(f"No transactions found for {date_str}, skipping CSV export")
@@ -138,7 +166,7 @@ class SalesbookExporter:
         csv_path = os.path.join(self.export_path, csv_filename)
 
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            with open(csv_path, 'w', newline='', encoding='utf-8-sig', buffering=_CSV_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'Date', 'Time', 'Receipt_Number', 'POS', 'Customer_Name', 'Customer_CRIB',
                     'Subtotal', 'Discount', 'Surcharge', 'Service_Charge', 'Tips', 'Total',
@@ -149,9 +177,7 @@ class SalesbookExporter:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
 
-                for transaction in transactions:
-                    row = self._extract_transaction_summary(transaction)
-                    writer.writerow(row)
+                self._write_rows(writer, (self._extract_transaction_summary(t) for t in transactions))
 
             logger.info(f"Exported {len(transactions)} transactions to {csv_path}")
             return csv_path
@@ -160,12 +186,17 @@ class SalesbookExporter:
             logger.error(f"Failed to export transactions summary: {e}")
             return None
 
-    def export_transactions_detailed(self, date: Optional[datetime.date] = None) -> Optional[str]:
+    def export_transactions_detailed(
+        self,
+        date: Optional[datetime.date] = None,
+        transactions: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[str]:
         """
         Export detailed transaction data to CSV with one row per line item.
 
         Args:
             date: Date to export (defaults to today)
+            transactions: Transactions already read for the date (read if omitted)
 
         Returns:
             str: Path to created CSV file, or None if failed
@@ -180,7 +211,8 @@ class SalesbookExporter:
             date = datetime.date.today()
 
         date_str = date.strftime('%Y-%m-%d')
-        transactions = self.read_transaction_files(date)
+        if transactions is None:
+            transactions = self.read_transaction_files(date)
 
         if not transactions:
             return None
@@ -190,7 +222,7 @@ class SalesbookExporter:
         csv_path = os.path.join(self.export_path, csv_filename)
 
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            with open(csv_path, 'w', newline='', encoding='utf-8-sig', buffering=_CSV_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'Date', 'Time', 'Receipt_Number', 'POS', 'Customer_Name', 'Customer_CRIB',
                     'Line_Number', 'Product_Code', 'Item_Description', 'Quantity', 'Unit_Price',
@@ -200,10 +232,9 @@ class SalesbookExporter:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
 
-                for transaction in transactions:
-                    rows = self._extract_transaction_details(transaction)
-                    for row in rows:
-                        writer.writerow(row)
+                self._write_rows(writer, (
+                    row for t in transactions for row in self._extract_transaction_details(t)
+                ))
 
             logger.info(f"Exported detailed transactions to {csv_path}")
             return csv_path
@@ -212,6 +243,15 @@ class SalesbookExporter:
             logger.error(f"Failed to export detailed transactions: {e}")
             return None
 
+    def _write_rows(self, writer: csv.DictWriter, rows) -> None:
+        """Write rows in batches of csv_batch_size instead of one call per row."""
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.csv_batch_size))
+            if not batch:
+                break
+            writer.writerows(batch)
+
     def _extract_transaction_summary(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
         """Extract summary data from a transaction."""
         # Parse timestamp from filename
@@ -357,8 +397,13 @@ class SalesbookExporter:
             return {"success": False, "error": "CSV export is disabled in config"}
 
         try:
-            summary_file = self.export_transactions_summary(date)
-            details_file = self.export_transactions_detailed(date)
+            # Read the day's files once for both CSVs; an empty day stops here
+            transactions = self.read_transaction_files(date)
+            if not transactions:
+                return {"success": False, "error": "No transactions to export"}
+
+            summary_file = self.export_transactions_summary(date, transactions)
+            details_file = self.export_transactions_detailed(date, transactions)
 
             if summary_file or details_file:
                 return {
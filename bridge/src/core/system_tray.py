@@ -12,6 +12,7 @@ import threading
 import queue
 import datetime
 import math
+import urllib3
 from PIL import Image
 import pystray
 from pystray import Menu as menu, MenuItem as item
@@ -22,6 +23,9 @@ from src.version import VERSION
 
 logger = logging.getLogger(__name__)
 
+# Disable SSL warnings for self-signed certificates (portal session uses verify=False)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
 
 # Determine base directory for logo
 if getattr(sys, 'frozen', False):
@@ -61,6 +65,7 @@ class SystemTray:
         self.software = software
         self.modal_queue = modal_queue
         self.icon = None
+        self._portal_session = None
 
         # Initialize WordPress command sender for cloud mode
         self.wp_sender = None
@@ -311,13 +316,32 @@ class SystemTray:
         except Exception as e:
             logger.error(f"Error opening POS frontend: {e}")
 
+    def _get_portal_session(self, username, app_password):
+        """
+        Return the pooled HTTP session used for BABCloud portal requests.
+
+        The session keeps the TCP/TLS connection alive between menu clicks
+        and carries the WordPress application password as basic auth.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from requests.auth import HTTPBasicAuth
+
+        if self._portal_session is None:
+            session = requests.Session()
+            session.verify = False
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._portal_session = session
+
+        self._portal_session.auth = HTTPBasicAuth(username, app_password)
+        return self._portal_session
+
     def _open_babcloud_portal(self):
         """Open BABCloud portal in browser with automatic login."""
         try:
             import webbrowser
-            import requests
-            import base64
-            from urllib.parse import urljoin
 
             logger.info("Opening BABCloud portal...")
 
@@ -335,15 +359,8 @@ class SystemTray:
             try:
                 # Generate autologin token via REST API
                 token_url = f"{base_url}/wp-json/babcloud/v1/autologin/generate-token"
-                auth_string = f"{username}:{app_password}"
-                auth_bytes = auth_string.encode('ascii')
-                auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-
-                headers = {
-                    'Authorization': f'Basic {auth_b64}'
-                }
-
-                response = requests.post(token_url, headers=headers, timeout=5, verify=False)
+                session = self._get_portal_session(username, app_password)
+                response = session.post(token_url, timeout=5)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -474,6 +491,15 @@ class SystemTray:
             logger.error(f"Error in system tray: {e}")
             raise
 
+    def notify(self, message):
+        """Show a tray balloon notification (ignored if the icon is not up)."""
+        if not self.icon:
+            return
+        try:
+            self.icon.notify(message, 'BAB Cloud PrintHub')
+        except Exception as e:
+            logger.warning(f"Could not show tray notification: {e}")
+
     def stop(self):
         """Stop the system tray icon."""
         if self.icon:
@@ -484,7 +510,7 @@ class SystemTray:
                 logger.error(f"Error stopping system tray: {e}")
 
 
-def start_system_tray(config, printer, software, modal_queue) -> threading.Thread:
+def start_system_tray(config, printer, software, modal_queue) -> tuple[SystemTray, threading.Thread]:
     """
     Start the system tray icon in a background thread.
 
@@ -495,11 +521,12 @@ def start_system_tray(config, printer, software, modal_queue) -> threading.Threa
         modal_queue: Queue for modal signaling
 
     Returns:
-        threading.Thread: System tray thread (already started)
+        tuple[SystemTray, threading.Thread]: The tray instance (used by the
+        caller for notifications) and its thread, already started
     """
     tray = SystemTray(config, printer, software, modal_queue)
     tray_thread = threading.Thread(target=tray.run, daemon=True, name="SystemTray")
     tray_thread.start()
 
     logger.info("System tray thread started")
-    return tray_thread
+    return tray, tray_thread
@@ -8,32 +8,15 @@ import logging
 import os
 import subprocess
 import sys
-from typing import Optional
-
-logger = logging.getLogger(__name__)
+from typing import Callable, Dict, Optional
 
+from src.core.runtime_env import INSTALL_DIR, IS_COMPILED
 
-def _is_compiled() -> bool:
-    """Check if running as compiled executable (Nuitka or PyInstaller)."""
-    # PyInstaller sets sys.frozen
-    if getattr(sys, "frozen", False):
-        return True
-    # Nuitka sets __compiled__ at module level
-    if "__compiled__" in globals():
-        return True
-    # Check if executable ends with .exe and is not python.exe/pythonw.exe
-    if sys.executable.lower().endswith('.exe'):
-        exe_name = os.path.basename(sys.executable).lower()
-        if exe_name not in ('python.exe', 'pythonw.exe', 'python3.exe', 'python313.exe'):
-            return True
-    return False
-
+logger = logging.getLogger(__name__)
 
-def _resolve_base_dir() -> str:
-    if _is_compiled():
-        return os.path.dirname(sys.executable)
-    # core -> src -> bridge
-    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Each modal is a separate interpreter with its own Qt runtime, so only one
+# is kept open at a time by default
+DEFAULT_MAX_MODALS = 1
 
 
 def _find_ui_python(base_dir: str) -> Optional[str]:
@@ -51,7 +34,7 @@ def _find_ui_python(base_dir: str) -> Optional[str]:
         if os.path.exists(candidate):
             return candidate
 
-    if not _is_compiled():
+    if not IS_COMPILED:
         return sys.executable
 
     return None
@@ -60,21 +43,53 @@ def _find_ui_python(base_dir: str) -> Optional[str]:
 class UIModalLauncher:
     """Launches UI modals with pipe credentials."""
 
-    def __init__(self, pipe_name: str, auth_key: bytes, base_dir: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        pipe_name: str,
+        auth_key: bytes,
+        base_dir: Optional[str] = None,
+        max_modals: int = DEFAULT_MAX_MODALS,
+        on_refused: Optional[Callable[[str], None]] = None,
+    ) -> None:
         self.pipe_name = pipe_name
         self.auth_key = auth_key
-        self.base_dir = base_dir or _resolve_base_dir()
+        self.base_dir = base_dir or INSTALL_DIR
         self.python_exe = _find_ui_python(self.base_dir)
         self.ui_entry = os.path.join(self.base_dir, "src", "core", "ui_modal_runner.py")
+        # Last process started per modal, used to ignore repeated opens
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self.max_modals = max(1, max_modals)
+        # Called with a user-facing message when a launch hits max_modals
+        self.on_refused = on_refused
+
+    def _reap_finished(self) -> None:
+        """Drop handles of modals that have exited (poll() also reaps them)."""
+        self._processes = {
+            name: proc for name, proc in self._processes.items() if proc.poll() is None
+        }
 
     def launch(self, modal_name: str) -> bool:
+        self._reap_finished()
+        running = self._processes.get(modal_name)
+        if running is not None:
+            logger.info("UI modal %s already open (PID: %s)", modal_name, running.pid)
+            return True
+        if len(self._processes) >= self.max_modals:
+            logger.warning(
+                "UI modal %s not launched: %d modal(s) already open (max %d)",
+                modal_name, len(self._processes), self.max_modals,
+            )
+            if self.on_refused:
+                self.on_refused("Another window is already open. Close it first.")
+            return False
+
         env = os.environ.copy()
         env["BAB_PIPE_NAME"] = self.pipe_name
         env["BAB_PIPE_KEY"] = self.auth_key.hex()
         env["BAB_UI_BASE"] = self.base_dir
         env["PYTHONPATH"] = f"{self.base_dir}{os.pathsep}{env.get('PYTHONPATH', '')}"
 
-        if _is_compiled():
+        if IS_COMPILED:
             # Use absolute path to ensure we launch the correct executable
             # even when the app is moved to a different location
             exe_path = os.path.abspath(sys.executable)
@@ -91,7 +106,7 @@ class UIModalLauncher:
         logger.info("Launching modal subprocess with args: %s", args)
         logger.info("Executable: %s", sys.executable)
         logger.info("Absolute exe path: %s", os.path.abspath(sys.executable))
-        logger.info("Is compiled: %s", _is_compiled())
+        logger.info("Is compiled: %s", IS_COMPILED)
         logger.info("Base directory: %s", self.base_dir)
         logger.info("Current working directory: %s", os.getcwd())
         logger.info("Exe exists: %s", os.path.exists(sys.executable))
@@ -103,7 +118,7 @@ class UIModalLauncher:
             return False
 
         try:
-            subprocess.Popen(
+            self._processes[modal_name] = subprocess.Popen(
                 args,
                 cwd=abs_base_dir,
                 env=env,
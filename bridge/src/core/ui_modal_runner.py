@@ -38,14 +38,20 @@ def main() -> int:
 
     logger.info("UI runner base dir: %s", base_dir)
 
+    config_path = os.path.join(base_dir, "config.json")
+
+    if modal_arg == "settings":
+        from src.core import config_settings_ui
+
+        config_settings_ui._open_config_settings_window(config_path)
+        return 0
+
     try:
         from src.core.config_manager import load_config
-        config_path = os.path.join(base_dir, "config.json")
         config = load_config(config_path)
     except Exception as exc:
         logger.error("Failed to load config: %s", exc)
         config = {}
-        config_path = os.path.join(base_dir, "config.json")
 
     if modal_arg == "fiscal_tools":
         from src.core import fiscal_ui
@@ -59,12 +65,6 @@ def main() -> int:
         export_ui._open_export_modal_original(config)
         return 0
 
-    if modal_arg == "settings":
-        from src.core import config_settings_ui
-
-        config_settings_ui._open_config_settings_window(config_path, config)
-        return 0
-
     logger.error("Unknown modal: %s", modal_arg)
     return 1
 
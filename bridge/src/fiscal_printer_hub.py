@@ -172,7 +172,7 @@ def main():
     logger.info("[4.5/7] Starting IPC server...")
     from src.core.ipc import PipeServer, make_pipe_name, make_auth_key
     from src.core.ipc_handlers import CoreCommandHandler
-    from src.core.ui_launcher import UIModalLauncher
+    from src.core.ui_launcher import UIModalLauncher, DEFAULT_MAX_MODALS
 
     ipc_handler = CoreCommandHandler(config, printer, software)
     pipe_name = make_pipe_name()
@@ -180,7 +180,11 @@ def main():
     ipc_server = PipeServer(pipe_name, auth_key, ipc_handler.handle, log=logger)
     ipc_server.start()
 
-    ui_launcher = UIModalLauncher(pipe_name, auth_key)
+    ui_launcher = UIModalLauncher(
+        pipe_name,
+        auth_key,
+        max_modals=config.get('system', {}).get('max_modals', DEFAULT_MAX_MODALS),
+    )
 
     # =========================================================================
     # Step 5: Start BABPortal Poller
@@ -208,7 +212,9 @@ def main():
     from src.core.system_tray import start_system_tray
 
     try:
-        tray_thread = start_system_tray(config, printer, software, modal_queue)
+        tray, tray_thread = start_system_tray(config, printer, software, modal_queue)
+        # Tell the user when a tray click is refused because a modal is open
+        ui_launcher.on_refused = tray.notify
         logger.info("✓ System tray started")
     except Exception as e:
         logger.error(f"✗ System tray failed: {e}")
@@ -366,7 +372,7 @@ def run_modal_standalone(modal_name):
         elif modal_name == 'settings':
             logger.info(f"[MODAL SUBPROCESS] Launching settings...")
             from src.core.config_settings_ui import _open_config_settings_window
-            _open_config_settings_window(config_path, config)
+            _open_config_settings_window(config_path)
         else:
             logger.error(f"[MODAL SUBPROCESS] Unknown modal: {modal_name}")
             _show_modal_error("Modal Error", f"Unknown modal: {modal_name}")
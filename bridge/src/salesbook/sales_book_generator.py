@@ -4,7 +4,6 @@ Generates CSV files formatted per Curaçao government Sales Book specifications
 """
 
 import os
-import json
 import hashlib
 from datetime import datetime
 from calendar import monthrange
@@ -14,6 +13,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.logger_module import logger
+from src.core.config_manager import load_config_cached
 from salesbook.printer_memory_reader import PrinterMemoryReader
 
 
@@ -108,10 +108,9 @@ class SalesBookGenerator:
 
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                logger.info(f"Configuration loaded from {config_path}")
-                return config
+                # Read-only use, so the parsed config can be shared between
+                # generators (one is built per export request)
+                return load_config_cached(config_path)
             else:
                 logger.warning(f"Configuration file not found: {config_path}")
                 logger.info("Using default configuration")
@@ -145,10 +144,7 @@ class SalesBookGenerator:
 
         try:
             # Parse date
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            day = date_obj.day
+            date_obj = datetime.fromisoformat(date_str)
 
             # Convert to printer format
             printer_date = date_obj.strftime("%d%m%Y")
@@ -160,21 +156,6 @@ class SalesBookGenerator:
                 logger.warning(f"No Z reports found for {date_str}")
                 return None
 
-            # Filter out system events, keep only sales reports (type 20)
-            sales_z_reports = [z for z in z_reports if z.get('report_type', '') == '20']
-
-            if not sales_z_reports:
-                logger.warning(f"No sales Z reports found for {date_str} (only system events)")
-                # Fall back to using any Z report
-                if z_reports:
-                    logger.info("Using non-sales Z report as fallback")
-                    z_report = z_reports[0]
-                else:
-                    return None
-            else:
-                # Use the first sales Z report for the day
-                z_report = sales_z_reports[0]
-
             # Read individual transactions for this date (if enabled)
             transactions = []
             if self.INCLUDE_TRANSACTION_DETAILS:
@@ -182,52 +163,156 @@ class SalesBookGenerator:
                 if not transactions:
                     logger.warning(f"No transactions found for {date_str}")
 
-            # Build CSV lines
-            line_type_2_records = self._build_line_type_2_records(transactions)
-            line_type_1_fields = self._build_line_type_1_fields(z_report, line_type_2_records)
-            line_type_2_lines = [self._join_fields(record["fields"]) for record in line_type_2_records]
+            return self._write_daily_csv(date_obj, z_reports, transactions)
 
-            if self.INCLUDE_SHA1:
-                line_type_1_fields[1] = ""
-                hash_input_lines = [self._join_fields(line_type_1_fields)] + line_type_2_lines
-                sha1_hash = self._calculate_sha1_hash(hash_input_lines)
-                line_type_1_fields[1] = sha1_hash
-            else:
-                sha1_hash = ""
+        except Exception as e:
+            logger.error(f"Error generating daily sales book: {e}")
+            return None
 
-            line_type_1 = self._join_fields(line_type_1_fields)
+    def generate_daily_csvs(self, date_strs):
+        """
+        Generate daily sales book CSVs for several dates with one Z report read
 
-            # Create directory structure
-            file_path = self._ensure_daily_directory(year, month, day)
+        Args:
+            date_strs: Dates in YYYY-MM-DD format (e.g., ["2025-12-20", "2025-12-21"])
 
-            if not file_path:
-                logger.error("Failed to create directory structure")
-                return None
+        Returns:
+            Dict mapping each date to its generated file path, or None on error
 
-            # Build filename
-            csv_filename = self._build_daily_filename(date_obj)
-            full_path = os.path.join(file_path, csv_filename)
+        Process:
+            1. Read Z reports once for the whole span and group them by date
+            2. For each requested date with Z reports, read that day's
+               transactions (the reader caps a single read, so a range read
+               could drop transactions on a busy week)
+            3. Write one daily CSV per requested date
+        """
+        results = {date_str: None for date_str in date_strs}
+        if not date_strs:
+            return results
 
-            # Write CSV file
-            with open(full_path, 'w', encoding='utf-8') as f:
-                # Write Line Type 1 (daily header)
-                f.write(line_type_1 + "\r\n")
+        logger.info(f"Generating daily sales books for {len(date_strs)} date(s)")
 
-                # Write Line Type 2 records (transactions)
-                for line in line_type_2_lines:
-                    f.write(line + "\r\n")
+        # A malformed date only fails that date, not the whole batch
+        date_objs = {}
+        for date_str in date_strs:
+            try:
+                date_objs[date_str] = datetime.fromisoformat(date_str)
+            except (TypeError, ValueError):
+                logger.error(f"Invalid sales book date: {date_str!r}")
+        if not date_objs:
+            return results
 
-            logger.info(f"Daily sales book generated: {full_path}")
-            logger.info(f"  Lines written: 1 header + {len(line_type_2_records)} transactions")
-            if self.INCLUDE_SHA1:
-                logger.info(f"  SHA-1 hash: {sha1_hash}")
+        try:
+            start_date = min(date_objs.values()).strftime("%d%m%Y")
+            end_date = max(date_objs.values()).strftime("%d%m%Y")
 
-            return full_path
+            z_reports = self.memory_reader.read_z_reports_by_date(start_date, end_date)
+
+            if not z_reports:
+                logger.warning(f"No Z reports found from {start_date} to {end_date}")
+                return results
+
+            # Group Z reports by date (YYYYMMDD)
+            z_reports_by_date = {}
+            for z_report in z_reports:
+                report_date = self._normalize_printer_date(z_report.get('date', ''))
+                if report_date:
+                    z_reports_by_date.setdefault(report_date, []).append(z_report)
 
         except Exception as e:
-            logger.error(f"Error generating daily sales book: {e}")
+            logger.error(f"Error reading sales book range: {e}")
+            return results
+
+        for date_str, date_obj in date_objs.items():
+            day_key = date_obj.strftime("%Y%m%d")
+            day_z_reports = z_reports_by_date.get(day_key)
+
+            if not day_z_reports:
+                logger.warning(f"No Z reports found for {date_str}")
+                continue
+
+            try:
+                day_transactions = []
+                if self.INCLUDE_TRANSACTION_DETAILS:
+                    printer_date = date_obj.strftime("%d%m%Y")
+                    day_transactions = self.memory_reader.read_transactions_by_date(printer_date, printer_date)
+                    if not day_transactions:
+                        logger.warning(f"No transactions found for {date_str}")
+
+                results[date_str] = self._write_daily_csv(date_obj, day_z_reports, day_transactions)
+            except Exception as e:
+                logger.error(f"Error generating daily sales book for {date_str}: {e}")
+
+        return results
+
+    def _write_daily_csv(self, date_obj, z_reports, transactions):
+        """
+        Build and write one daily sales book CSV
+
+        Args:
+            date_obj: datetime of the sales day
+            z_reports: Z reports read for that day (at least one)
+            transactions: Transactions read for that day
+
+        Returns:
+            Full file path of generated CSV, or None on error
+        """
+        date_str = date_obj.strftime("%Y-%m-%d")
+
+        # Filter out system events, keep only sales reports (type 20)
+        sales_z_reports = [z for z in z_reports if z.get('report_type', '') == '20']
+
+        if not sales_z_reports:
+            logger.warning(f"No sales Z reports found for {date_str} (only system events)")
+            # Fall back to using any Z report
+            logger.info("Using non-sales Z report as fallback")
+            z_report = z_reports[0]
+        else:
+            # Use the first sales Z report for the day
+            z_report = sales_z_reports[0]
+
+        # Build CSV lines
+        line_type_2_records = self._build_line_type_2_records(transactions)
+        line_type_1_fields = self._build_line_type_1_fields(z_report, line_type_2_records)
+        line_type_2_lines = [self._join_fields(record["fields"]) for record in line_type_2_records]
+
+        if self.INCLUDE_SHA1:
+            line_type_1_fields[1] = ""
+            hash_input_lines = [self._join_fields(line_type_1_fields)] + line_type_2_lines
+            sha1_hash = self._calculate_sha1_hash(hash_input_lines)
+            line_type_1_fields[1] = sha1_hash
+        else:
+            sha1_hash = ""
+
+        line_type_1 = self._join_fields(line_type_1_fields)
+
+        # Create directory structure
+        file_path = self._ensure_daily_directory(date_obj.year, date_obj.month, date_obj.day)
+
+        if not file_path:
+            logger.error("Failed to create directory structure")
             return None
 
+        # Build filename
+        csv_filename = self._build_daily_filename(date_obj)
+        full_path = os.path.join(file_path, csv_filename)
+
+        # Write CSV file
+        with open(full_path, 'w', encoding='utf-8') as f:
+            # Write Line Type 1 (daily header)
+            f.write(line_type_1 + "\r\n")
+
+            # Write Line Type 2 records (transactions)
+            for line in line_type_2_lines:
+                f.write(line + "\r\n")
+
+        logger.info(f"Daily sales book generated: {full_path}")
+        logger.info(f"  Lines written: 1 header + {len(line_type_2_records)} transactions")
+        if self.INCLUDE_SHA1:
+            logger.info(f"  SHA-1 hash: {sha1_hash}")
+
+        return full_path
+
     def generate_monthly_csv(self, year, month):
         """
         Generate monthly sales book CSV
@@ -546,9 +631,30 @@ class SalesBookGenerator:
             logger.error(f"Error calculating SHA-1 hash: {e}")
             return "0" * 40
 
+    def existing_daily_csv(self, date_str):
+        """
+        Return the path of the daily sales book CSV already written for a date
+
+        Args:
+            date_str: Date in YYYY-MM-DD format (e.g., "2025-12-20")
+
+        Returns:
+            Full file path if the file exists, otherwise None
+        """
+        try:
+            date_obj = datetime.fromisoformat(date_str)
+        except ValueError:
+            return None
+        dir_path = self._daily_directory(date_obj.year, date_obj.month, date_obj.day)
+        full_path = os.path.join(dir_path, self._build_daily_filename(date_obj))
+        return full_path if os.path.isfile(full_path) else None
+
+    def _daily_directory(self, year, month, day):
+        return os.path.join(self.BASE_DIRECTORY, str(year), f"{month:02d}", f"{day:02d}")
+
     def _ensure_daily_directory(self, year, month, day):
         try:
-            dir_path = os.path.join(self.BASE_DIRECTORY, str(year), f"{month:02d}", f"{day:02d}")
+            dir_path = self._daily_directory(year, month, day)
             os.makedirs(dir_path, exist_ok=True)
             logger.info(f"Directory ensured: {dir_path}")
             return dir_path
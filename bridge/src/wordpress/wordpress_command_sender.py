@@ -39,6 +39,27 @@ class WordPressCommandSender:
         self.device_id = self.wordpress_config.get('device_id')
         self.device_token = self.wordpress_config.get('device_token')
 
+        # URL and auth headers are fixed for the lifetime of the sender
+        self._commands_url = f"{self.wordpress_url}/wp-json/babcloud/v1/printer/{self.device_id}/commands"
+        self._session = None
+
+    def _get_session(self):
+        """
+        Return the keep-alive session used for Portal requests.
+
+        Created on first use so the device token header is attached once and
+        the TCP/TLS connection is reused across commands.
+        """
+        if self._session is None:
+            session = requests.Session()
+            session.verify = False
+            session.headers.update({
+                'X-Device-Token': self.device_token,
+                'Content-Type': 'application/json'
+            })
+            self._session = session
+        return self._session
+
     def _send_command(self, command_type, params=None):
         """
         Send a command to WordPress REST API.
@@ -54,13 +75,6 @@ class WordPressCommandSender:
             logger.error(f"Portal API not configured - URL: {self.wordpress_url}, Device ID: {self.device_id}, Token present: {bool(self.device_token)}")
             return {"success": False, "error": "Portal API not configured", "error_code": "config_missing"}
 
-        url = f"{self.wordpress_url}/wp-json/babcloud/v1/printer/{self.device_id}/commands"
-
-        headers = {
-            'X-Device-Token': self.device_token,
-            'Content-Type': 'application/json'
-        }
-
         payload = {
             "command_type": command_type,
             "params": params or {},
@@ -68,10 +82,10 @@ class WordPressCommandSender:
 
         try:
             logger.info(f"Sending command to Portal: {command_type}")
-            logger.debug(f"  URL: {url}")
-            logger.debug(f"  Device ID: {self.device_id}")
-            logger.debug(f"  Token (first 10 chars): {self.device_token[:10] if self.device_token else 'None'}...")
-            response = requests.post(url, json=payload, headers=headers, verify=False, timeout=5)
+            logger.debug("  URL: %s", self._commands_url)
+            logger.debug("  Device ID: %s", self.device_id)
+            logger.debug("  Token (first 10 chars): %s...", self.device_token[:10] if self.device_token else "None")
+            response = self._get_session().post(self._commands_url, json=payload, timeout=5)
 
             if response.status_code == 200:
                 data = response.json()